@@ -1,7 +1,7 @@
 # monowidget 包初始化文件
 # 导出主要的公共API
 
-from .mono import Mono, MonoAttr
+from .mono import Mono, MonoAttr, MonoGroup, MonoJournal, MonoSweep, SweepTable, computed, ComputedError, MonoPresetBank
 from .inspector import QMonoInspector, QMonoAttrItem
 
 __all__ = [
@@ -11,4 +11,11 @@ __all__ = [
     'QMonoAttrItem',
     'Mono',
     'MonoAttr',
+    'MonoGroup',
+    'MonoJournal',
+    'MonoSweep',
+    'SweepTable',
+    'computed',
+    'ComputedError',
+    'MonoPresetBank',
 ]
\ No newline at end of file
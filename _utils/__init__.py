@@ -3,8 +3,21 @@
 
 from .ordered_dict import IdOrderedDict
 from .rangef import rangef
+from .attr_index import AttrIndex
+from .attr_path import resolve_path, get_path, set_path, has_path
+from .values_equal import values_equal
+from .ring_buffer import RingBuffer
+from .public_attrs import public_attrs
 
 __all__ = [
     'IdOrderedDict',
     'rangef',
+    'AttrIndex',
+    'resolve_path',
+    'get_path',
+    'set_path',
+    'has_path',
+    'values_equal',
+    'RingBuffer',
+    'public_attrs',
 ]
\ No newline at end of file
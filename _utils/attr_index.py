@@ -0,0 +1,119 @@
+import re
+from bisect import bisect_left
+
+
+class AttrIndex:
+    """
+    属性检索索引
+    对属性名、标签和分组建立索引，支持前缀匹配与模糊(子序列)匹配
+
+    示例:
+        >>> index = AttrIndex()
+        >>> index.add("blur_radius", label="Blur", group="Filter")
+        >>> index.add("brightness", group="Color")
+        >>> index.search("br")
+        ['brightness', 'blur_radius']
+    """
+
+    _SPLIT = re.compile(r'[\s_.\-/]+')
+
+    def __init__(self):
+        self._names = []
+        self._order = {}
+        self._texts = []
+        self._tokens = []
+        self._dirty = False
+        self._last_query = None
+        self._last_matches = None
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._order
+
+    def add(self, name, label=None, group=None):
+        """添加一个属性条目"""
+        if name in self._order:
+            return
+        parts = [name, label or '', group or '']
+        text = ' '.join(part.lower() for part in parts if part)
+        self._order[name] = len(self._names)
+        self._names.append(name)
+        self._texts.append(text)
+        tokens = set(self._SPLIT.split(text))
+        tokens.add(name.lower())
+        for token in tokens:
+            if token:
+                self._tokens.append((token, name))
+        self._dirty = True
+        self._last_query = None
+
+    def clear(self):
+        """清空索引"""
+        self._names.clear()
+        self._order.clear()
+        self._texts.clear()
+        self._tokens.clear()
+        self._dirty = False
+        self._last_query = None
+        self._last_matches = None
+
+    def match(self, query):
+        """返回匹配查询的属性名集合，空查询匹配全部"""
+        terms = self._terms(query)
+        if not terms:
+            return set(self._names)
+
+        key = ' '.join(terms)
+        # 查询只增不减时结果单调收缩，可在上次结果内继续筛选
+        if self._last_query is not None and key.startswith(self._last_query):
+            candidates = self._last_matches
+        else:
+            candidates = range(len(self._names))
+
+        patterns = [self._fuzzy_pattern(term) for term in terms]
+        texts = self._texts
+        matches = [i for i in candidates
+                   if all(pattern.search(texts[i]) for pattern in patterns)]
+
+        self._last_query = key
+        self._last_matches = matches
+        return {self._names[i] for i in matches}
+
+    def search(self, query):
+        """返回匹配的属性名列表，前缀匹配排在模糊匹配之前"""
+        matched = self.match(query)
+        terms = self._terms(query)
+        if not terms:
+            return list(self._names)
+
+        prefixed = None
+        for term in terms:
+            names = self._prefix_names(term)
+            prefixed = names if prefixed is None else prefixed & names
+        prefixed &= matched
+
+        order = self._order.__getitem__
+        return sorted(prefixed, key=order) + sorted(matched - prefixed, key=order)
+
+    def _prefix_names(self, prefix):
+        """通过二分查找获取存在以prefix开头的词元的属性名"""
+        if self._dirty:
+            self._tokens.sort()
+            self._dirty = False
+        tokens = self._tokens
+        names = set()
+        i = bisect_left(tokens, (prefix, ''))
+        while i < len(tokens) and tokens[i][0].startswith(prefix):
+            names.add(tokens[i][1])
+            i += 1
+        return names
+
+    @staticmethod
+    def _terms(query):
+        return query.lower().split() if query else []
+
+    @staticmethod
+    def _fuzzy_pattern(term):
+        return re.compile('.*?'.join(re.escape(ch) for ch in term))
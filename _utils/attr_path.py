@@ -0,0 +1,38 @@
+def resolve_path(obj, path):
+    """
+    解析点分属性路径，返回 (所属对象, 末级属性名)
+
+    示例:
+        >>> owner, name = resolve_path(analyzer, "plot.title")
+        >>> owner is analyzer.plot, name
+        (True, 'title')
+    """
+    *parents, name = path.split('.')
+    for part in parents:
+        obj = getattr(obj, part)
+    return obj, name
+
+
+def get_path(obj, path):
+    """按点分路径读取属性值"""
+    owner, name = resolve_path(obj, path)
+    return getattr(owner, name)
+
+
+def set_path(obj, path, value):
+    """按点分路径设置属性值"""
+    owner, name = resolve_path(obj, path)
+    setattr(owner, name, value)
+
+
+def has_path(obj, path):
+    """判断点分路径是否存在"""
+    try:
+        owner, name = resolve_path(obj, path)
+        getattr(owner, name)
+    except AttributeError:
+        return False
+    except Exception:
+        # 属性存在但求值失败，例如计算出错的派生属性
+        return True
+    return True
@@ -0,0 +1,20 @@
+def public_attrs(obj):
+    """
+    获取对象的公开非方法属性名
+    派生属性直接计入而不求值，其他属性读取失败时跳过，扫描不会执行可能抛出异常的计算
+    """
+    is_computed = getattr(obj, 'is_computed', None)
+    names = []
+    for name in dir(obj):
+        if name.startswith('_'):
+            continue
+        if is_computed is not None and is_computed(name):
+            names.append(name)
+            continue
+        try:
+            value = getattr(obj, name)
+        except Exception:
+            continue
+        if not callable(value):
+            names.append(name)
+    return names
@@ -0,0 +1,90 @@
+import threading
+from array import array
+
+
+class RingBuffer:
+    """
+    定长环形缓冲区，使用array存储 (时间, 值) 序列
+    写满后覆盖最旧的数据，内存占用固定
+
+    示例:
+        >>> buf = RingBuffer(3)
+        >>> for i in range(5):
+        ...     buf.append(i, i * 10)
+        >>> buf.values()
+        [20.0, 30.0, 40.0]
+    """
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("RingBuffer capacity must be positive")
+        self.capacity = capacity
+        self._times = array('d', bytes(8 * capacity))
+        self._values = array('d', bytes(8 * capacity))
+        self._start = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self.version = 0  # 每次写入递增，用于判断显示是否需要刷新
+
+    def __len__(self):
+        return self._size
+
+    def append(self, t, value):
+        """追加一个数据点"""
+        with self._lock:
+            if self._size < self.capacity:
+                index = self._start + self._size
+                if index >= self.capacity:
+                    index -= self.capacity
+                self._size += 1
+            else:
+                index = self._start
+                self._start = index + 1 if index + 1 < self.capacity else 0
+            self._times[index] = t
+            self._values[index] = value
+            self.version += 1
+
+    def clear(self):
+        """清空缓冲区"""
+        with self._lock:
+            self._start = 0
+            self._size = 0
+            self.version += 1
+
+    def _ordered(self, data):
+        end = self._start + self._size
+        if end <= self.capacity:
+            return data[self._start:end]
+        return data[self._start:] + data[:end - self.capacity]
+
+    def snapshot(self):
+        """按时间顺序返回 (时间数组, 值数组) 的拷贝"""
+        with self._lock:
+            return self._ordered(self._times), self._ordered(self._values)
+
+    def times(self):
+        return self.snapshot()[0].tolist()
+
+    def values(self):
+        return self.snapshot()[1].tolist()
+
+    def decimate(self, buckets):
+        """
+        抽稀为最多 2*buckets 个点，每个区间保留最小值和最大值，保留尖峰
+        返回按时间顺序的 (时间, 值) 列表
+        """
+        times, values = self.snapshot()
+        size = len(values)
+        if size <= buckets * 2:
+            return list(zip(times, values))
+        points = []
+        step = size / buckets
+        for bucket in range(buckets):
+            lo = int(bucket * step)
+            hi = int((bucket + 1) * step)
+            chunk = values[lo:hi]
+            i_min = lo + chunk.index(min(chunk))
+            i_max = lo + chunk.index(max(chunk))
+            for i in sorted((i_min, i_max)) if i_min != i_max else (i_min,):
+                points.append((times[i], values[i]))
+        return points
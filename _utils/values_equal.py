@@ -0,0 +1,42 @@
+import math
+
+
+def values_equal(a, b):
+    """
+    按类型比较两个参数值是否相等
+
+    与 == 的区别:
+        - bool 与数字不相等 (True != 1)
+        - 两个 NaN 视为相等，避免变化检测反复写回
+        - list/tuple/dict 逐元素递归比较
+
+    示例:
+        >>> values_equal(float('nan'), float('nan'))
+        True
+        >>> values_equal(True, 1)
+        False
+    """
+    if a is b:
+        return True
+
+    a_bool, b_bool = isinstance(a, bool), isinstance(b, bool)
+    if a_bool or b_bool:
+        return a_bool and b_bool and a == b
+
+    if isinstance(a, float) or isinstance(b, float):
+        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+            return False
+        if a != a and b != b:
+            return True
+        return a == b or math.isclose(a, b, rel_tol=1e-12, abs_tol=0.0)
+
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(values_equal(x, y) for x, y in zip(a, b))
+
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(values_equal(a[key], b[key]) for key in a)
+
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
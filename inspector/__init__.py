@@ -4,9 +4,24 @@
 from .qmono_inspector import QMonoInspector
 from .qmono_attr_item import QMonoAttrItem
 from .qmono_attr_item_factory import QMonoAttrItemFactory
+from .qmono_config_watcher import QMonoConfigWatcher
+from .qmono_group_section import QMonoGroupSection
+from .qmono_recorder import QMonoRecorder, QSparkline
+from .qmono_theme import QMonoTheme, register_theme, get_theme
+from .qmono_preset_morph import QMonoPresetMorph
+from .qmono_poll_scheduler import QMonoPollScheduler
 
 __all__ = [
     'QMonoInspector',
     'QMonoAttrItem',
     'QMonoAttrItemFactory',
+    'QMonoConfigWatcher',
+    'QMonoGroupSection',
+    'QMonoRecorder',
+    'QSparkline',
+    'QMonoTheme',
+    'register_theme',
+    'get_theme',
+    'QMonoPresetMorph',
+    'QMonoPollScheduler',
 ]
\ No newline at end of file
@@ -2,20 +2,30 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QLineEdit, QSpinBox, QDoubleSpinBox, QCheckBox, 
                             QComboBox, QTextEdit, QPushButton)
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from .qmono_theme import get_theme, DEFAULT_THEME
 
 
 class QMonoAttrItem(QWidget):
-    """单个属性编辑项"""
+    """
+    单个属性编辑项
+    self.value 缓存当前值，只在编辑时更新，get_value()不读取控件
+    """
     
     value_changed = pyqtSignal(str, object)  # 属性名, 新值
     
-    def __init__(self, name, value, parent=None):
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
         super().__init__(parent)
         self.name = name
         self.value = value
+        self.attr = attr
+        # 名称字体所用的主题，默认为内置主题
+        self.theme = get_theme(theme if theme is not None else DEFAULT_THEME)
+        self.mixed = False
+        self.error = None
+        self.readonly = False
+        self._updating = False
         self._setup_ui()
-        self._set_value(value)
+        self.set_value(value)
         
     def _setup_ui(self):
         """设置用户界面"""
@@ -23,33 +33,67 @@ class QMonoAttrItem(QWidget):
         self.setLayout(layout)
         
         # 属性名称标签
-        name_label = QLabel(self.name)
-        name_font = QFont()
-        name_font.setBold(True)
-        name_label.setFont(name_font)
-        layout.addWidget(name_label)
+        self.name_label = QLabel(self.label)
+        self.name_label.setObjectName("monoAttrName")
+        self.name_label.setFont(self.theme.font('name'))
+        layout.addWidget(self.name_label)
         
         # 值编辑控件
         self.value_widget = self._create_value_widget()
         layout.addWidget(self.value_widget)
         
+        # 派生属性计算失败时代替值控件显示
+        self.error_label = QLabel("n/a")
+        self.error_label.setObjectName("monoAttrError")
+        self.error_label.setVisible(False)
+        layout.addWidget(self.error_label)
+        
+    @property
+    def label(self):
+        """显示用的标签，优先使用MonoAttr的label"""
+        name = self.name.rsplit('.', 1)[-1]
+        if self.attr is not None:
+            return self.attr.kwargs.get('label', name)
+        return name
+
     def _create_value_widget(self):
         """根据值的类型创建合适的编辑控件"""
-        if isinstance(self.value, bool):
+        attr = self.attr
+        ranged = attr is not None and attr.minimum is not None
+        
+        if attr is not None and attr.choices is not None:
+            choices = attr.choices
+            widget = QComboBox()
+            widget.addItems([str(choice) for choice in choices])
+            widget.currentIndexChanged.connect(
+                lambda index: self._on_value_changed(choices[index]) if index >= 0 else None)
+            return widget
+            
+        elif isinstance(self.value, bool):
             widget = QCheckBox()
             widget.stateChanged.connect(lambda: self._on_value_changed(widget.isChecked()))
             return widget
             
         elif isinstance(self.value, int):
             widget = QSpinBox()
-            widget.setRange(-999999, 999999)
+            if ranged:
+                widget.setRange(int(attr.minimum), int(attr.maximum))
+                if attr.step:
+                    widget.setSingleStep(max(1, int(attr.step)))
+            else:
+                widget.setRange(-999999, 999999)
             widget.valueChanged.connect(lambda: self._on_value_changed(widget.value()))
             return widget
             
         elif isinstance(self.value, float):
             widget = QDoubleSpinBox()
-            widget.setRange(-999999.0, 999999.0)
             widget.setDecimals(6)
+            if ranged:
+                widget.setRange(float(attr.minimum), float(attr.maximum))
+                if attr.step:
+                    widget.setSingleStep(float(attr.step))
+            else:
+                widget.setRange(-999999.0, 999999.0)
             widget.valueChanged.connect(lambda: self._on_value_changed(widget.value()))
             return widget
             
@@ -74,8 +118,34 @@ class QMonoAttrItem(QWidget):
             widget.textChanged.connect(lambda: self._on_value_changed(widget.text()))
             return widget
             
+    def set_readonly(self, readonly):
+        """设置只读，用于派生属性和readonly=True的属性"""
+        self.readonly = readonly
+        widget = self.value_widget
+        if hasattr(widget, 'setReadOnly'):
+            widget.setReadOnly(readonly)
+        else:
+            widget.setEnabled(not readonly)
+        
+    def set_mixed(self, mixed):
+        """标记多个对象在该属性上的值不一致"""
+        self.mixed = mixed
+        self.name_label.setText(f"{self.label} (mixed)" if mixed else self.label)
+        self.name_label.setToolTip("Values differ between selected objects" if mixed else "")
+        
+    def set_error(self, message):
+        """显示读取失败的状态，message为None时恢复值控件"""
+        self.error = message
+        self.value_widget.setVisible(message is None)
+        self.error_label.setVisible(message is not None)
+        self.error_label.setToolTip(message or "")
+        
     def _on_value_changed(self, new_value):
-        """处理值变化"""
+        """处理控件编辑产生的值变化，程序设置值时忽略"""
+        if self._updating:
+            return
+        if self.mixed:
+            self.set_mixed(False)
         self.value = new_value
         self.value_changed.emit(self.name, new_value)
         
@@ -84,9 +154,26 @@ class QMonoAttrItem(QWidget):
         return self.value
         
     def set_value(self, value):
-        """设置值"""
+        """设置值，缓存原始值，不会发出value_changed"""
+        self._updating = True
+        try:
+            if self.value is None and value is not None:
+                # 创建时没有可用的值(派生属性计算失败)，取得值后按类型重建控件
+                self._rebuild_value_widget(value)
+            self.value = value
+            self._set_value(value)
+        finally:
+            self._updating = False
+        if self.error is not None:
+            self.set_error(None)
+        
+    def _rebuild_value_widget(self, value):
+        old = self.value_widget
         self.value = value
-        self._set_value(value)
+        self.value_widget = self._create_value_widget()
+        self.layout().replaceWidget(old, self.value_widget)
+        old.setParent(None)
+        self.set_readonly(self.readonly)
         
     def _set_value(self, value):
         """设置控件值"""
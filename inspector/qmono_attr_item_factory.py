@@ -4,33 +4,37 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QSlider, QDateEdit, QTimeEdit, QDateTimeEdit)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIntValidator, QDoubleValidator
+import json
+from .qmono_theme import get_theme, DEFAULT_THEME
 
 
 class QMonoAttrItemFactory:
     """属性项工厂，根据数据类型创建合适的编辑控件"""
     
     @staticmethod
-    def create_item(name, value, parent=None):
-        """根据值类型创建合适的属性项"""
-        if isinstance(value, bool):
-            return QBoolItem(name, value, parent)
+    def create_item(name, value, parent=None, attr=None, theme=None):
+        """根据值类型和MonoAttr约束创建合适的属性项，theme为名称字体所用的主题，默认为内置主题"""
+        if attr is not None and attr.choices is not None:
+            return QEnumItem(name, value, parent, attr, theme)
+        elif isinstance(value, bool):
+            return QBoolItem(name, value, parent, attr, theme)
         elif isinstance(value, int):
-            return QIntItem(name, value, parent)
+            return QIntItem(name, value, parent, attr, theme)
         elif isinstance(value, float):
-            return QFloatItem(name, value, parent)
+            return QFloatItem(name, value, parent, attr, theme)
         elif isinstance(value, str):
-            if self._is_path_like(name):
-                return QFilePathItem(name, value, parent)
+            if QMonoAttrItemFactory._is_path_like(name):
+                return QFilePathItem(name, value, parent, attr, theme)
             elif '\n' in value or len(value) > 100:
-                return QTextItem(name, value, parent)
+                return QTextItem(name, value, parent, attr, theme)
             else:
-                return QStringItem(name, value, parent)
+                return QStringItem(name, value, parent, attr, theme)
         elif isinstance(value, list):
-            return QListItem(name, value, parent)
+            return QListItem(name, value, parent, attr, theme)
         elif isinstance(value, dict):
-            return QDictItem(name, value, parent)
+            return QDictItem(name, value, parent, attr, theme)
         else:
-            return QStringItem(name, str(value), parent)
+            return QStringItem(name, str(value), parent, attr, theme)
     
     @staticmethod
     def _is_path_like(name):
@@ -40,14 +44,20 @@ class QMonoAttrItemFactory:
 
 
 class QBaseItem(QWidget):
-    """基础属性项"""
+    """
+    基础属性项
+    self.value 缓存当前的规范值，只在编辑时更新，get_value()不再读取和解析控件
+    """
     
     value_changed = pyqtSignal(str, object)  # 属性名, 新值
     
-    def __init__(self, name, value, parent=None):
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
         super().__init__(parent)
         self.name = name
         self.value = value
+        self.attr = attr
+        self.theme = get_theme(theme if theme is not None else DEFAULT_THEME)
+        self._updating = False
         self._setup_ui()
         
     def _setup_ui(self):
@@ -56,139 +66,200 @@ class QBaseItem(QWidget):
         self.setLayout(layout)
         
         # 属性名称
-        self.name_label = QLabel(self.name)
-        self.name_label.setStyleSheet("font-weight: bold;")
+        self.name_label = QLabel(self.attr.kwargs.get('label', self.name) if self.attr else self.name)
+        self.name_label.setObjectName("monoAttrName")
+        self.name_label.setFont(self.theme.font('name'))
         layout.addWidget(self.name_label)
         
+    def set_readonly(self, readonly):
+        """设置只读，禁用名称标签以外的编辑控件"""
+        for child in self.findChildren(QWidget):
+            if child is not self.name_label:
+                child.setEnabled(not readonly)
+        
+    def _commit(self, value):
+        """控件被编辑时更新缓存值并发出信号，程序设置值时忽略"""
+        if self._updating:
+            return
+        self.value = value
+        self.value_changed.emit(self.name, value)
+        
     def get_value(self):
         """获取当前值"""
-        raise NotImplementedError
+        return self.value
         
     def set_value(self, value):
-        """设置值"""
+        """设置值，不会发出value_changed"""
+        self._updating = True
+        try:
+            self.value = value
+            self._set_widget_value(value)
+        finally:
+            self._updating = False
+            
+    def _set_widget_value(self, value):
+        """将值显示到控件"""
         raise NotImplementedError
 
 
 class QBoolItem(QBaseItem):
     """布尔类型属性项"""
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         self.checkbox = QCheckBox()
         self.checkbox.setChecked(value)
-        self.checkbox.stateChanged.connect(lambda: self.value_changed.emit(self.name, self.checkbox.isChecked()))
+        self.checkbox.stateChanged.connect(lambda: self._commit(self.checkbox.isChecked()))
         self.layout().addWidget(self.checkbox)
         
-    def get_value(self):
-        return self.checkbox.isChecked()
-        
-    def set_value(self, value):
+    def _set_widget_value(self, value):
         self.checkbox.setChecked(bool(value))
 
 
 class QIntItem(QBaseItem):
     """整数类型属性项"""
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         self.spinbox = QSpinBox()
-        self.spinbox.setRange(-999999, 999999)
+        if attr is not None and attr.minimum is not None:
+            self.spinbox.setRange(int(attr.minimum), int(attr.maximum))
+            if attr.step:
+                self.spinbox.setSingleStep(max(1, int(attr.step)))
+        else:
+            self.spinbox.setRange(-999999, 999999)
         self.spinbox.setValue(value)
-        self.spinbox.valueChanged.connect(lambda: self.value_changed.emit(self.name, self.spinbox.value()))
+        self.spinbox.valueChanged.connect(lambda: self._commit(self.spinbox.value()))
         self.layout().addWidget(self.spinbox)
         
-    def get_value(self):
-        return self.spinbox.value()
-        
-    def set_value(self, value):
+    def _set_widget_value(self, value):
         self.spinbox.setValue(int(value))
 
 
 class QFloatItem(QBaseItem):
-    """浮点数类型属性项"""
+    """
+    浮点数类型属性项
+    旋转框只显示6位小数，缓存值保留对象中的原始浮点数，避免变化检测反复写回
+    """
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         
         # 创建水平布局
         h_layout = QHBoxLayout()
         
         # 双精度旋转框
         self.spinbox = QDoubleSpinBox()
-        self.spinbox.setRange(-999999.0, 999999.0)
         self.spinbox.setDecimals(6)
+        if attr is not None and attr.minimum is not None:
+            self._minimum, self._maximum = float(attr.minimum), float(attr.maximum)
+            self.spinbox.setRange(self._minimum, self._maximum)
+            if attr.step:
+                self.spinbox.setSingleStep(float(attr.step))
+        else:
+            self._minimum, self._maximum = 0.0, 10.0
+            self.spinbox.setRange(-999999.0, 999999.0)
         self.spinbox.setValue(value)
-        self.spinbox.valueChanged.connect(lambda: self.value_changed.emit(self.name, self.spinbox.value()))
+        self.spinbox.valueChanged.connect(self._on_spinbox_changed)
         h_layout.addWidget(self.spinbox)
         
-        # 滑块
+        # 滑块，按步长划分刻度，未指定步长时划分为1000份
+        step = attr.step if attr is not None else None
+        span = self._maximum - self._minimum
+        self._ticks = max(1, int(round(span / step))) if step else 1000
         self.slider = QSlider(Qt.Orientation.Horizontal)
-        self.slider.setRange(0, 1000)
-        self.slider.setValue(int(value * 100))
+        self.slider.setRange(0, self._ticks)
+        self.slider.setValue(self._to_tick(value))
         self.slider.valueChanged.connect(lambda: self._on_slider_changed())
         h_layout.addWidget(self.slider)
         
         self.layout().addLayout(h_layout)
         
+    def _to_tick(self, value):
+        """浮点值映射到滑块刻度"""
+        span = self._maximum - self._minimum
+        tick = round((float(value) - self._minimum) / span * self._ticks) if span else 0
+        return min(max(tick, 0), self._ticks)
+        
+    def _on_spinbox_changed(self, value):
+        """旋转框值变化处理，同步滑块但不让滑块回写旋转框"""
+        self.slider.blockSignals(True)
+        self.slider.setValue(self._to_tick(value))
+        self.slider.blockSignals(False)
+        self._commit(value)
+        
     def _on_slider_changed(self):
         """滑块值变化处理"""
-        value = self.slider.value() / 100.0
+        span = self._maximum - self._minimum
+        value = self._minimum + self.slider.value() * span / self._ticks
         self.spinbox.setValue(value)
         
-    def get_value(self):
-        return self.spinbox.value()
-        
-    def set_value(self, value):
+    def _set_widget_value(self, value):
         self.spinbox.setValue(float(value))
-        self.slider.setValue(int(float(value) * 100))
+
+
+class QEnumItem(QBaseItem):
+    """枚举类型属性项"""
+    
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
+        self.choices = list(attr.choices)
+        self.combobox = QComboBox()
+        self.combobox.addItems([str(choice) for choice in self.choices])
+        self._set_widget_value(value)
+        self.combobox.currentIndexChanged.connect(self._on_index_changed)
+        self.layout().addWidget(self.combobox)
+        
+    def _on_index_changed(self, index):
+        if index >= 0:
+            self._commit(self.choices[index])
+        
+    def _set_widget_value(self, value):
+        index = self.combobox.findText(str(value))
+        if index >= 0:
+            self.combobox.setCurrentIndex(index)
 
 
 class QStringItem(QBaseItem):
     """字符串类型属性项"""
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         self.lineedit = QLineEdit()
         self.lineedit.setText(str(value))
-        self.lineedit.textChanged.connect(lambda: self.value_changed.emit(self.name, self.lineedit.text()))
+        self.lineedit.textChanged.connect(lambda: self._commit(self.lineedit.text()))
         self.layout().addWidget(self.lineedit)
         
-    def get_value(self):
-        return self.lineedit.text()
-        
-    def set_value(self, value):
+    def _set_widget_value(self, value):
         self.lineedit.setText(str(value))
 
 
 class QTextItem(QBaseItem):
     """文本类型属性项"""
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         self.textedit = QTextEdit()
         self.textedit.setText(str(value))
-        self.textedit.textChanged.connect(lambda: self.value_changed.emit(self.name, self.textedit.toPlainText()))
+        self.textedit.textChanged.connect(lambda: self._commit(self.textedit.toPlainText()))
         self.layout().addWidget(self.textedit)
         
-    def get_value(self):
-        return self.textedit.toPlainText()
-        
-    def set_value(self, value):
+    def _set_widget_value(self, value):
         self.textedit.setText(str(value))
 
 
 class QFilePathItem(QBaseItem):
     """文件路径类型属性项"""
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         
         # 创建水平布局
         h_layout = QHBoxLayout()
         
         self.lineedit = QLineEdit()
         self.lineedit.setText(str(value))
-        self.lineedit.textChanged.connect(lambda: self.value_changed.emit(self.name, self.lineedit.text()))
+        self.lineedit.textChanged.connect(lambda: self._commit(self.lineedit.text()))
         h_layout.addWidget(self.lineedit)
         
         self.browse_btn = QPushButton("Browse")
@@ -203,18 +274,15 @@ class QFilePathItem(QBaseItem):
         if file_path:
             self.lineedit.setText(file_path)
             
-    def get_value(self):
-        return self.lineedit.text()
-        
-    def set_value(self, value):
+    def _set_widget_value(self, value):
         self.lineedit.setText(str(value))
 
 
 class QListItem(QBaseItem):
     """列表类型属性项"""
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         
         # 创建垂直布局
         v_layout = QVBoxLayout()
@@ -222,7 +290,7 @@ class QListItem(QBaseItem):
         # 列表显示
         self.textedit = QTextEdit()
         self.textedit.setPlainText('\n'.join(map(str, value)))
-        self.textedit.textChanged.connect(lambda: self.value_changed.emit(self.name, self._parse_list()))
+        self.textedit.textChanged.connect(lambda: self._commit(self._parse_list()))
         v_layout.addWidget(self.textedit)
         
         self.layout().addLayout(v_layout)
@@ -232,42 +300,40 @@ class QListItem(QBaseItem):
         text = self.textedit.toPlainText()
         return [line.strip() for line in text.split('\n') if line.strip()]
         
-    def get_value(self):
-        return self._parse_list()
-        
-    def set_value(self, value):
+    def _set_widget_value(self, value):
         self.textedit.setPlainText('\n'.join(map(str, value)))
 
 
 class QDictItem(QBaseItem):
     """字典类型属性项"""
     
-    def __init__(self, name, value, parent=None):
-        super().__init__(name, value, parent)
+    def __init__(self, name, value, parent=None, attr=None, theme=None):
+        super().__init__(name, value, parent, attr, theme)
         
         # 创建垂直布局
         v_layout = QVBoxLayout()
         
         # 字典显示
         self.textedit = QTextEdit()
-        import json
         self.textedit.setPlainText(json.dumps(value, indent=2, ensure_ascii=False))
-        self.textedit.textChanged.connect(lambda: self.value_changed.emit(self.name, self._parse_dict()))
+        self.textedit.textChanged.connect(self._on_text_changed)
         v_layout.addWidget(self.textedit)
         
         self.layout().addLayout(v_layout)
         
     def _parse_dict(self):
-        """解析文本为字典"""
+        """解析文本为字典，无法解析时返回None"""
         try:
-            import json
-            return json.loads(self.textedit.toPlainText())
-        except:
-            return {}
+            value = json.loads(self.textedit.toPlainText())
+        except ValueError:
+            return None
+        return value if isinstance(value, dict) else None
+        
+    def _on_text_changed(self):
+        # 输入过程中的不完整JSON不提交，保留上一次的有效值
+        value = self._parse_dict()
+        if value is not None:
+            self._commit(value)
             
-    def get_value(self):
-        return self._parse_dict()
-        
-    def set_value(self, value):
-        import json
-        self.textedit.setPlainText(json.dumps(value, indent=2, ensure_ascii=False))
\ No newline at end of file
+    def _set_widget_value(self, value):
+        self.textedit.setPlainText(json.dumps(value, indent=2, ensure_ascii=False))
@@ -0,0 +1,105 @@
+import json
+import os
+
+from PyQt6.QtCore import (QObject, QRunnable, QThreadPool, QTimer,
+                          QFileSystemWatcher, pyqtSignal)
+
+
+class _ConfigParseTask(QRunnable):
+    """在线程池中读取并解析配置文件"""
+
+    def __init__(self, watcher, path, generation):
+        super().__init__()
+        self.watcher = watcher
+        self.path = path
+        self.generation = generation
+
+    def run(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except Exception as e:
+            self.watcher._parse_failed.emit(self.generation, str(e))
+            return
+        self.watcher._parsed.emit(self.generation, config)
+
+
+class QMonoConfigWatcher(QObject):
+    """
+    配置文件监视器
+    文件变化经过去抖后在后台线程解析，解析结果回到GUI线程发出
+    """
+
+    config_changed = pyqtSignal(dict)  # 解析后的配置
+    error = pyqtSignal(str)  # 错误信息
+
+    _parsed = pyqtSignal(int, object)
+    _parse_failed = pyqtSignal(int, str)
+
+    def __init__(self, path, delay=200, parent=None):
+        """
+        Args:
+            path: 要监视的配置文件路径
+            delay: 去抖延迟(毫秒)，连续写入只触发一次解析
+        """
+        super().__init__(parent)
+        self.path = os.path.abspath(path)
+        self._generation = 0
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(delay)
+        self._debounce.timeout.connect(self._start_parse)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watch_path()
+
+        self._parsed.connect(self._on_parsed)
+        self._parse_failed.connect(self._on_parse_failed)
+
+    def _watch_path(self):
+        """监视文件及其所在目录，目录用于发现被替换或重建的文件"""
+        directory = os.path.dirname(self.path)
+        if directory not in self._watcher.directories():
+            self._watcher.addPath(directory)
+        if os.path.exists(self.path) and self.path not in self._watcher.files():
+            self._watcher.addPath(self.path)
+
+    def stop(self):
+        """停止监视，丢弃尚未返回的解析结果"""
+        self._debounce.stop()
+        self._generation += 1
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+
+    def _on_file_changed(self, path):
+        # 很多编辑器通过替换文件保存，监视会随之失效，需要重新加入
+        self._watch_path()
+        self._debounce.start()
+
+    def _on_directory_changed(self, path):
+        if os.path.exists(self.path) and self.path not in self._watcher.files():
+            self._watch_path()
+            self._debounce.start()
+
+    def _start_parse(self):
+        if not os.path.exists(self.path):
+            return
+        self._generation += 1
+        QThreadPool.globalInstance().start(_ConfigParseTask(self, self.path, self._generation))
+
+    def _on_parsed(self, generation, config):
+        # 只接受最近一次解析的结果
+        if generation != self._generation:
+            return
+        if isinstance(config, dict):
+            self.config_changed.emit(config)
+        else:
+            self.error.emit("Configuration root must be a JSON object")
+
+    def _on_parse_failed(self, generation, message):
+        if generation == self._generation:
+            self.error.emit(message)
@@ -0,0 +1,61 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QToolButton, QSizePolicy
+from PyQt6.QtCore import Qt, pyqtSignal
+
+
+class QMonoGroupSection(QWidget):
+    """可折叠的属性分组，内容在第一次展开时才构建"""
+
+    expanded_changed = pyqtSignal(bool)  # 是否展开
+
+    def __init__(self, title, names, builder, parent=None):
+        """
+        Args:
+            title: 分组标题
+            names: 分组内的属性名列表
+            builder: 首次展开时调用的构建函数，参数为 (section, content_layout)
+        """
+        super().__init__(parent)
+        self.names = list(names)
+        self.built = False
+        self._builder = builder
+        self._setup_ui(title)
+
+    def _setup_ui(self, title):
+        """设置用户界面"""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        # 标题按钮
+        self.toggle_btn = QToolButton()
+        self.toggle_btn.setText(title)
+        self.toggle_btn.setCheckable(True)
+        self.toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        self.toggle_btn.setArrowType(Qt.ArrowType.RightArrow)
+        self.toggle_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.toggle_btn.toggled.connect(self.set_expanded)
+        layout.addWidget(self.toggle_btn)
+
+        # 内容区域
+        self.content = QWidget()
+        self.content_layout = QVBoxLayout()
+        self.content_layout.setContentsMargins(12, 0, 0, 0)
+        self.content.setLayout(self.content_layout)
+        self.content.setVisible(False)
+        layout.addWidget(self.content)
+
+    def is_expanded(self):
+        return self.toggle_btn.isChecked()
+
+    def set_expanded(self, expanded):
+        """展开或折叠分组"""
+        if self.toggle_btn.isChecked() != expanded:
+            # 通过toggled信号再次进入
+            self.toggle_btn.setChecked(expanded)
+            return
+        if expanded and not self.built:
+            self.built = True
+            self._builder(self, self.content_layout)
+        self.toggle_btn.setArrowType(Qt.ArrowType.DownArrow if expanded else Qt.ArrowType.RightArrow)
+        self.content.setVisible(expanded)
+        self.expanded_changed.emit(expanded)
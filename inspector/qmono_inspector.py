@@ -1,9 +1,16 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, 
-                            QPushButton, QLabel, QFileDialog, QMessageBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont
-from mono import Mono
+                            QPushButton, QLabel, QFileDialog, QMessageBox,
+                            QLineEdit, QApplication)
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent
+from mono import Mono, MonoGroup, ComputedError
+from _utils import AttrIndex, resolve_path, get_path, set_path, has_path, values_equal, public_attrs
 from .qmono_attr_item import QMonoAttrItem
+from .qmono_config_watcher import QMonoConfigWatcher
+from .qmono_group_section import QMonoGroupSection
+from .qmono_recorder import QMonoRecorder, QSparkline
+from .qmono_theme import get_theme, DEFAULT_THEME
+from .qmono_preset_morph import QMonoPresetMorph
+from .qmono_poll_scheduler import QMonoPollScheduler
 import json
 
 
@@ -11,11 +18,25 @@ class QMonoInspector(QWidget):
     """参数检查器主窗口"""
     
     parameter_changed = pyqtSignal(str, object)  # 参数名, 新值
+    parameters_changed = pyqtSignal(dict)  # 批量更新的 {参数名: 新值}
+    
+    # 过滤后一次最多显示的顶层控件数，显示控件需要重新布局，开销与数量成正比
+    FILTER_WINDOW = 200
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.mono = None
         self.attr_items = {}
+        self.group_sections = {}
+        self.nested_sections = {}
+        self.attr_index = AttrIndex()
+        self.config_path = None
+        self.config_watcher = None
+        self.recorder = None
+        self.preset_morph = None
+        self._filter_matches = []
+        self._filter_shown = 0
+        self.theme = get_theme(DEFAULT_THEME)
         self._setup_ui()
         self._setup_timer()
         
@@ -29,19 +50,25 @@ class QMonoInspector(QWidget):
         self.setLayout(layout)
         
         # 标题
-        title = QLabel("Parameter Inspector")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title)
+        self.title_label = QLabel("Parameter Inspector")
+        self.title_label.setObjectName("monoTitle")
+        self.title_label.setFont(self.theme.font('title'))
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.title_label)
+        
+        # 搜索框
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search parameters...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self._apply_filter)
+        layout.addWidget(self.search_edit)
         
         # 滚动区域
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         layout.addWidget(scroll)
+        self.scroll_area = scroll
         
         # 滚动内容
         self.scroll_content = QWidget()
@@ -65,59 +92,519 @@ class QMonoInspector(QWidget):
         button_layout.addWidget(self.reset_btn)
         
         layout.addLayout(button_layout)
+        self.set_theme(self.theme)
         
+    def set_theme(self, theme):
+        """
+        切换主题，只在检查器上设置一次样式表和调色板，不重建属性项
+        
+        Args:
+            theme: 主题名称或QMonoTheme对象
+        """
+        self.theme = get_theme(theme)
+        palette = self.theme.palette()
+        self.setPalette(palette if palette is not None else QApplication.palette())
+        self.setStyleSheet(self.theme.stylesheet)
+        self.title_label.setFont(self.theme.font('title'))
+        name_font = self.theme.font('name')
+        for label in self.findChildren(QLabel, "monoAttrName"):
+            label.setFont(name_font)
+            
     def _setup_timer(self):
-        """设置定时器用于参数变化检测"""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._check_changes)
-        self.timer.start(100)  # 100ms检查一次
+        """设置自适应调度器用于参数变化检测，检查器显示后才开始轮询"""
+        self.poll_scheduler = QMonoPollScheduler(self._check_changes, parent=self)
+        self.poll_scheduler.pause()
+        # 滚动后新露出的行需要尽快同步
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.poll_scheduler.poke)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._reveal_matches)
+        
+    def poll_stats(self):
+        """变化检测的单次开销统计，用于调整轮询参数"""
+        return self.poll_scheduler.stats
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.window().isMinimized():
+            self.poll_scheduler.resume()
+            
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.poll_scheduler.pause()
+        
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self.poll_scheduler.pause()
+            elif self.isVisible():
+                self.poll_scheduler.resume()
         
     def set_mono(self, mono):
         """设置要检查的Mono对象"""
+        # 未完成的渐变属于之前的对象
+        self.stop_morph()
         self.mono = mono
+        if self.recorder is not None:
+            self.recorder.mono = mono
         self._update_ui()
+        self.poll_scheduler.poke()
+        
+    def set_monos(self, monos):
+        """同时检查多个Mono对象，只显示共有属性，编辑会应用到所有对象"""
+        monos = list(monos)
+        self.set_mono(monos[0] if len(monos) == 1 else MonoGroup(monos))
         
     def _update_ui(self):
         """更新UI显示"""
         # 清除现有项目
-        for item in self.attr_items.values():
-            item.setParent(None)
+        self._filter_matches = []
+        self._filter_shown = 0
+        while self.scroll_layout.count():
+            widget = self.scroll_layout.takeAt(0).widget()
+            if widget is not None:
+                widget.setParent(None)
         self.attr_items.clear()
+        if self.recorder is not None:
+            self.recorder.detach_sparklines()
+        self.group_sections.clear()
+        self.nested_sections.clear()
+        self.attr_index.clear()
+        self.title_label.setText("Parameter Inspector")
         
         if not self.mono:
             return
             
-        # 获取所有属性
-        attrs = []
-        for attr_name in dir(self.mono):
-            if not attr_name.startswith('_') and not callable(getattr(self.mono, attr_name)):
-                attrs.append(attr_name)
+        # 按MonoAttr的group分组，未分组的属性直接显示
+        ungrouped = []
+        groups = {}
+        headers = {}
+        expanded = set()
+        for attr_name in self._public_attrs(self.mono):
+            attr = self._attr_meta(attr_name)
+            kwargs = attr.kwargs if attr is not None else {}
+            group = kwargs.get('group')
+            self.attr_index.add(attr_name, kwargs.get('label', attr_name), group)
+            self._index_nested(attr_name)
+            if 'title' in kwargs:
+                self.title_label.setText(str(kwargs['title']))
+            if group is None:
+                ungrouped.append(attr_name)
+                continue
+            groups.setdefault(group, []).append(attr_name)
+            if 'header' in kwargs:
+                headers.setdefault(group, kwargs['header'])
+            if kwargs.get('expanded'):
+                expanded.add(group)
                 
         # 创建属性项
-        for attr_name in sorted(attrs):
-            attr_item = QMonoAttrItem(attr_name, getattr(self.mono, attr_name))
-            attr_item.value_changed.connect(self._on_value_changed)
-            self.scroll_layout.addWidget(attr_item)
-            self.attr_items[attr_name] = attr_item
+        self._build_items(ungrouped, self.scroll_layout)
+        
+        # 分组默认折叠，其中的属性项在首次展开时才创建
+        for group, names in groups.items():
+            section = QMonoGroupSection(
+                str(headers.get(group, group)), names,
+                lambda section, layout: self._build_items(section.names, layout)
+            )
+            section.expanded_changed.connect(
+                lambda expanded, section=section: expanded and self._refresh_section(section))
+            self.scroll_layout.addWidget(section)
+            self.group_sections[group] = section
+            if group in expanded:
+                section.set_expanded(True)
             
         # 添加弹簧
         self.scroll_layout.addStretch()
+        self._apply_filter(self.search_edit.text())
+        
+    @staticmethod
+    def _public_attrs(obj):
+        """获取对象的公开非方法属性名，派生属性不会被求值"""
+        return sorted(public_attrs(obj))
+        
+    def _read_value(self, path):
+        """
+        读取属性值，派生属性计算失败时不抛出
+        
+        Returns:
+            (值, 错误信息)，读取成功时错误信息为None
+        """
+        try:
+            return get_path(self.mono, path), None
+        except ComputedError as e:
+            return None, str(e)
+        
+    def _build_items(self, names, layout):
+        """创建属性项并加入布局，嵌套的Mono创建为可展开的子检查器"""
+        items = []
+        for path in names:
+            value, error = self._read_value(path)
+            attr = self._attr_meta(path)
+            if isinstance(value, (Mono, MonoGroup)):
+                label = attr.kwargs.get('label', path) if attr is not None else path
+                section = QMonoGroupSection(
+                    str(label), [path],
+                    lambda section, layout, path=path: self._build_nested(section, path, layout)
+                )
+                section.expanded_changed.connect(
+                    lambda expanded, section=section: expanded and self._refresh_section(section))
+                layout.addWidget(section)
+                self.nested_sections[path] = section
+                continue
+            attr_item = QMonoAttrItem(path, value, attr=attr, theme=self.theme)
+            if error is not None:
+                attr_item.set_error(error)
+            attr_item.value_changed.connect(self._on_value_changed)
+            if self._is_computed(path) or (attr is not None and attr.kwargs.get('readonly')):
+                attr_item.set_readonly(True)
+            layout.addWidget(attr_item)
+            self.attr_items[path] = attr_item
+            items.append(attr_item)
+            if self.recorder is not None and path in self.recorder:
+                self._attach_sparkline(attr_item)
+        self._update_mixed(items)
+        if self.search_edit.text():
+            self._apply_filter(self.search_edit.text())
+        return items
+        
+    def _index_nested(self, path, parents=()):
+        """
+        为嵌套Mono的属性建立索引，只读取属性名而不创建控件
+        子检查器折叠时其中的属性也能被搜索到
+        """
+        if self._is_computed(path):
+            return
+        mono, _ = self._read_value(path)
+        if not isinstance(mono, (Mono, MonoGroup)) or id(mono) in parents:
+            return
+        parents = parents + (id(mono),)
+        for name in self._public_attrs(mono):
+            name = '{}.{}'.format(path, name)
+            attr = self._attr_meta(name)
+            kwargs = attr.kwargs if attr is not None else {}
+            self.attr_index.add(name, kwargs.get('label', name), kwargs.get('group'))
+            self._index_nested(name, parents)
+        
+    def _build_nested(self, section, path, layout):
+        """首次展开嵌套Mono时创建其属性项，属性以点分路径命名，索引已在_update_ui中建立"""
+        mono = get_path(self.mono, path)
+        names = ['{}.{}'.format(path, name) for name in self._public_attrs(mono)]
+        section.names.extend(names)
+        self._build_items(names, layout)
+        
+    def _refresh_section(self, section):
+        """展开时同步分组内的属性项，折叠期间它们不参与变化检测"""
+        self._sync_items(section.content.findChildren(QMonoAttrItem))
+        
+    def _update_mixed(self, items):
+        """多对象模式下标记值不一致的属性，返回标记发生变化的项数"""
+        changed = 0
+        for item in items:
+            owner, name = resolve_path(self.mono, item.name)
+            is_mixed = getattr(owner, 'is_mixed', None)
+            if is_mixed is not None:
+                mixed = is_mixed(name)
+                if mixed != item.mixed:
+                    item.set_mixed(mixed)
+                    changed += 1
+        return changed
+        
+    def _is_computed(self, path):
+        """判断是否为派生属性"""
+        owner, name = resolve_path(self.mono, path)
+        is_computed = getattr(owner, 'is_computed', None)
+        return bool(is_computed and is_computed(name))
+        
+    def _sync_affected(self, paths):
+        """刷新受这些属性影响的派生属性项"""
+        items = []
+        for path in paths:
+            owner, name = resolve_path(self.mono, path)
+            affected = getattr(owner, 'affected', None)
+            if not affected:
+                continue
+            prefix = path[:len(path) - len(name)]
+            for derived in affected(name):
+                item = self.attr_items.get(prefix + derived)
+                if item is not None:
+                    items.append(item)
+        self._sync_items(items)
+        
+    def _attr_meta(self, path):
+        """获取属性的MonoAttr元数据"""
+        owner, name = resolve_path(self.mono, path)
+        get_attr = getattr(owner, 'get_attr', None)
+        return get_attr(name) if get_attr else None
+        
+    def _apply_filter(self, text):
+        """根据搜索文本显示或隐藏属性项和分组，不重建控件"""
+        matched = self.attr_index.match(text)
+        # 嵌套属性匹配时，包含它的子检查器和分组也要显示
+        scopes = set(matched)
+        for name in matched:
+            while '.' in name:
+                name = name.rsplit('.', 1)[0]
+                if name in scopes:
+                    break
+                scopes.add(name)
+        wanted = {item: name in matched for name, item in self.attr_items.items()}
+        for section in list(self.group_sections.values()) + list(self.nested_sections.values()):
+            wanted[section] = any(name in scopes for name in section.names)
+        # 顶层的匹配项按布局顺序只显示前FILTER_WINDOW个，其余滚动到底部时再显示
+        layout = self.scroll_layout
+        self._filter_matches = [widget for widget in (layout.itemAt(i).widget() for i in range(layout.count()))
+                                if wanted.get(widget)]
+        self._filter_shown = min(len(self._filter_matches), self.FILTER_WINDOW)
+        for widget in self._filter_matches[self._filter_shown:]:
+            wanted[widget] = False
+        # 只切换可见性真正变化的控件，没有变化时不触碰界面
+        toggles = [(widget, visible) for widget, visible in wanted.items() if widget.isHidden() == visible]
+        self._set_visible([widget for widget, visible in toggles if not visible], False)
+        self._set_visible([widget for widget, visible in toggles if visible], True)
+        
+    def _reveal_matches(self, value):
+        """滚动到底部附近时显示下一批匹配项"""
+        bar = self.scroll_area.verticalScrollBar()
+        if self._filter_shown >= len(self._filter_matches) or value < bar.maximum() - bar.pageStep():
+            return
+        start = self._filter_shown
+        self._filter_shown = min(len(self._filter_matches), start + self.FILTER_WINDOW)
+        self._set_visible(self._filter_matches[start:self._filter_shown], True)
+            
+    def _set_visible(self, widgets, visible):
+        """成批切换可见性，切换期间停用布局，结束后只重新计算一次"""
+        if not widgets:
+            return
+        # 在可见的父控件中逐个显示子控件时，Qt每次都会同步激活父布局
+        layout = self.scroll_layout
+        layout.setEnabled(False)
+        for widget in widgets:
+            widget.setVisible(visible)
+        layout.setEnabled(True)
+        layout.activate()
+        if visible:
+            # 隐藏期间不参与变化检测，重新显示时同步一次
+            self._sync_items([widget for widget in widgets if isinstance(widget, QMonoAttrItem)])
         
     def _on_value_changed(self, name, value):
         """处理属性值变化"""
         if self.mono:
-            setattr(self.mono, name, value)
+            set_path(self.mono, name, value)
+            self._sync_affected([name])
             self.parameter_changed.emit(name, value)
             
-    def _check_changes(self):
-        """检查外部对属性的修改"""
+    def apply_values(self, values):
+        """
+        批量设置参数值
+        所有值写入后只刷新对应的属性项，并发出一次parameters_changed
+        """
+        if not self.mono:
+            return {}
+        
+        values = {name: value for name, value in values.items() if has_path(self.mono, name)}
+        for name, value in values.items():
+            set_path(self.mono, name, value)
+                
+        for name, value in values.items():
+            item = self.attr_items.get(name)
+            if item is not None:
+                self._sync_item(item, value)
+                if item.mixed:
+                    item.set_mixed(False)
+        self._sync_affected(values)
+                    
+        if values:
+            self.parameters_changed.emit(values)
+        return values
+        
+    def _sync_item(self, item, value):
+        """用对象中的值刷新属性项，不触发value_changed"""
+        item.set_value(value)
+            
+    def set_journal(self, journal):
+        """将所有参数变化记录到MonoJournal"""
+        self.parameter_changed.connect(journal.record)
+        self.parameters_changed.connect(journal.record_many)
+        
+    def switch_preset(self, bank, name):
+        """切换到预设，只批量应用与当前状态不同的字段"""
+        if not self.mono:
+            return {}
+        self.stop_morph()
+        return self.apply_values(bank.diff(self.mono, name))
+        
+    def morph_preset(self, bank, name, duration=1000):
+        """
+        从当前状态渐变到预设，数值字段按帧插值
+        
+        Args:
+            bank: MonoPresetBank
+            name: 目标预设名
+            duration: 渐变时长(毫秒)
+        """
+        if not self.mono:
+            return None
+        self.stop_morph()
+        end = bank.values(name)
+        start = {field: get_path(self.mono, field) for field in end if has_path(self.mono, field)}
+        self.preset_morph = QMonoPresetMorph(self, bank, self)
+        self.preset_morph.start(start, end, duration)
+        return self.preset_morph
+        
+    def stop_morph(self):
+        """停止正在进行的预设渐变"""
+        if self.preset_morph is not None:
+            self.preset_morph.stop()
+            self.preset_morph.deleteLater()
+            self.preset_morph = None
+            
+    def enable_recording(self, names, capacity=4096, interval=None):
+        """
+        记录属性的时间序列，并在对应属性项中显示迷你折线图
+        
+        Args:
+            names: 要记录的属性名(可以是点分路径)
+            capacity: 每个属性保留的数据点数
+            interval: 采样间隔(毫秒)，用于记录其他线程修改的值；为None时只记录界面上的修改
+        """
+        if self.recorder is None:
+            self.recorder = QMonoRecorder(self.mono, capacity=capacity, interval=interval, parent=self)
+            self.parameter_changed.connect(self.recorder.record)
+            self.parameters_changed.connect(self.recorder.record_many)
+        for name in names:
+            self.recorder.add(name)
+            item = self.attr_items.get(name)
+            if item is not None:
+                self._attach_sparkline(item)
+        return self.recorder
+        
+    def disable_recording(self):
+        """停止记录并移除所有迷你折线图"""
+        if self.recorder is None:
+            return
+        self.recorder.stop()
+        self.parameter_changed.disconnect(self.recorder.record)
+        self.parameters_changed.disconnect(self.recorder.record_many)
+        for name in list(self.recorder.buffers):
+            self.recorder.remove(name)
+        self.recorder.deleteLater()
+        self.recorder = None
+        
+    def _attach_sparkline(self, item):
+        """在属性项下方加入迷你折线图"""
+        if item.findChild(QSparkline) is None:
+            item.layout().addWidget(self.recorder.create_sparkline(item.name, item))
+            
+    def watch_config(self, path=None, delay=200):
+        """
+        监视配置文件，文件被外部修改时只应用有变化的字段
+        
+        Args:
+            path: 配置文件路径，默认为最近一次保存或加载的文件
+            delay: 去抖延迟(毫秒)
+        """
+        path = path or self.config_path
+        if not path:
+            raise ValueError("No configuration file to watch")
+        self.unwatch_config()
+        self.config_path = path
+        self.config_watcher = QMonoConfigWatcher(path, delay, self)
+        self.config_watcher.config_changed.connect(self._on_config_changed)
+        return self.config_watcher
+        
+    def unwatch_config(self):
+        """停止监视配置文件"""
+        if self.config_watcher is not None:
+            self.config_watcher.stop()
+            self.config_watcher.deleteLater()
+            self.config_watcher = None
+            
+    def _on_config_changed(self, config):
+        """对比配置与当前对象状态，只应用变化的字段"""
         if not self.mono:
             return
+        values, errors = self._validate_config(config)
+        if errors and self.config_watcher is not None:
+            self.config_watcher.error.emit('\n'.join(errors.values()))
+        changed = {}
+        for key, value in values.items():
+            if not values_equal(get_path(self.mono, key), value):
+                changed[key] = value
+        if changed:
+            self.apply_values(changed)
+            
+    def _validate_config(self, config):
+        """按MonoAttr约束批量校验配置，返回以点分路径为键的 (合法值, 错误信息)"""
+        config = self._flatten_config(self.mono, config)
+        validate_config = getattr(self.mono, 'validate_config', None)
+        if validate_config is not None:
+            return validate_config(config)
+        return {key: value for key, value in config.items() if has_path(self.mono, key)}, {}
+        
+    @classmethod
+    def _config_dict(cls, obj):
+        """将对象的属性导出为配置字典，嵌套的Mono导出为嵌套字典"""
+        config = {}
+        is_computed = getattr(obj, 'is_computed', None)
+        for name in cls._public_attrs(obj):
+            if is_computed is not None and is_computed(name):
+                continue
+            value = getattr(obj, name)
+            config[name] = cls._config_dict(value) if isinstance(value, (Mono, MonoGroup)) else value
+        return config
+        
+    @classmethod
+    def _flatten_config(cls, obj, config, prefix=''):
+        """将嵌套Mono对应的嵌套字典展开为点分路径"""
+        flat = {}
+        for key, value in config.items():
+            current = getattr(obj, key, None)
+            if isinstance(current, (Mono, MonoGroup)) and isinstance(value, dict):
+                flat.update(cls._flatten_config(current, value, prefix + key + '.'))
+            else:
+                flat[prefix + key] = value
+        return flat
             
-        for name, item in self.attr_items.items():
-            current_value = getattr(self.mono, name)
-            if current_value != item.get_value():
-                item.set_value(current_value)
+    def _check_changes(self, include_offscreen=False):
+        """
+        检查外部对属性的修改，由轮询调度器调用
+        
+        Args:
+            include_offscreen: 是否同时检查滚动到视口外的属性项
+            
+        Returns:
+            (检查的项数, 变化的项数)
+        """
+        # 嵌入在其他窗口中时收不到自身的最小化事件，在这里跳过
+        if not self.mono or self.window().isMinimized():
+            return 0, 0
+            
+        # 折叠的分组和子检查器在展开时再同步，过滤隐藏的项在重新显示时同步
+        content = self.scroll_content
+        if include_offscreen:
+            items = [item for item in self.attr_items.values() if item.isVisibleTo(content)]
+        else:
+            # visibleRegion 已经按滚动区域的视口裁剪，视口外的项为空
+            items = [item for item in self.attr_items.values() if not item.visibleRegion().isEmpty()]
+        return len(items), self._sync_items(items)
+        
+    def _sync_items(self, items):
+        """将对象中已变化的值同步到属性项，返回变化的项数"""
+        if not self.mono:
+            return 0
+        changed = 0
+        for item in items:
+            current_value, error = self._read_value(item.name)
+            if error is not None:
+                if error != item.error:
+                    item.set_error(error)
+                    changed += 1
+            elif item.error is not None or not values_equal(current_value, item.get_value()):
+                self._sync_item(item, current_value)
+                changed += 1
+        # 代表值只来自第一个实例，其他实例的变化只能通过重新比较发现
+        if isinstance(self.mono, MonoGroup):
+            changed += self._update_mixed(items)
+        return changed
                 
     def _save_config(self):
         """保存配置"""
@@ -130,13 +617,11 @@ class QMonoInspector(QWidget):
         
         if file_path:
             try:
-                config = {}
-                for attr_name in dir(self.mono):
-                    if not attr_name.startswith('_') and not callable(getattr(self.mono, attr_name)):
-                        config[attr_name] = getattr(self.mono, attr_name)
+                config = self._config_dict(self.mono)
                         
                 with open(file_path, 'w', encoding='utf-8') as f:
                     json.dump(config, f, indent=2, ensure_ascii=False)
+                self.config_path = file_path
                     
                 QMessageBox.information(self, "Success", "Configuration saved successfully!")
                 
@@ -157,12 +642,19 @@ class QMonoInspector(QWidget):
                 with open(file_path, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                     
-                for key, value in config.items():
-                    if hasattr(self.mono, key):
-                        setattr(self.mono, key, value)
+                values, errors = self._validate_config(config)
+                for key, value in values.items():
+                    set_path(self.mono, key, value)
                         
+                self.config_path = file_path
                 self._update_ui()
-                QMessageBox.information(self, "Success", "Configuration loaded successfully!")
+                if errors:
+                    QMessageBox.warning(
+                        self, "Warning",
+                        "Some parameters were not loaded:\n" + '\n'.join(errors.values())
+                    )
+                else:
+                    QMessageBox.information(self, "Success", "Configuration loaded successfully!")
                 
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load configuration: {str(e)}")
@@ -179,12 +671,15 @@ class QMonoInspector(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # 创建新的实例来重置
-            new_mono = self.mono.__class__()
-            
-            # 复制属性值
-            for attr_name in dir(self.mono):
-                if not attr_name.startswith('_') and not callable(getattr(self.mono, attr_name)):
-                    setattr(self.mono, attr_name, getattr(new_mono, attr_name))
+            monos = self.mono.instances if isinstance(self.mono, MonoGroup) else [self.mono]
+            for mono in monos:
+                # 创建新的实例来重置
+                new_mono = mono.__class__()
+                
+                # 复制属性值，派生属性会随输入自动更新
+                is_computed = getattr(mono, 'is_computed', None)
+                for attr_name in self._public_attrs(mono):
+                    if is_computed is None or not is_computed(attr_name):
+                        setattr(mono, attr_name, getattr(new_mono, attr_name))
                     
             self._update_ui()
\ No newline at end of file
@@ -0,0 +1,96 @@
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class QMonoPollScheduler(QObject):
+    """
+    自适应轮询调度器
+    可见行按基础间隔检查，屏幕外的行每隔若干次才检查一次；
+    连续没有变化时间隔指数退避，检测到变化或调用poke()时恢复基础间隔
+    """
+
+    tick_finished = pyqtSignal(dict)  # 每次检查后的统计信息
+
+    def __init__(self, check, interval=50, max_interval=1000, offscreen_every=10, parent=None):
+        """
+        Args:
+            check: 回调 check(include_offscreen) -> (检查的项数, 变化的项数)
+            interval: 基础检查间隔(毫秒)
+            max_interval: 退避的最大间隔(毫秒)
+            offscreen_every: 每隔多少次检查包含一次屏幕外的行
+        """
+        super().__init__(parent)
+        self.check = check
+        self.base_interval = interval
+        self.max_interval = max_interval
+        self.offscreen_every = max(1, offscreen_every)
+        self.interval = interval
+        self.ticks = 0
+        self.last_cost = 0.0
+        self.average_cost = 0.0
+        self.last_checked = 0
+        self.last_changed = 0
+        self._paused = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def stats(self):
+        """单次检查的开销统计，时间单位为毫秒"""
+        return {
+            'ticks': self.ticks,
+            'interval': self.interval,
+            'last_cost': self.last_cost,
+            'average_cost': self.average_cost,
+            'checked': self.last_checked,
+            'changed': self.last_changed,
+            'paused': self._paused,
+        }
+
+    def is_paused(self):
+        return self._paused
+
+    def start(self):
+        """以基础间隔开始轮询"""
+        self._paused = False
+        self.interval = self.base_interval
+        self._timer.start(self.interval)
+
+    def pause(self):
+        """暂停轮询，例如检查器被隐藏或最小化时"""
+        self._paused = True
+        self._timer.stop()
+
+    def resume(self):
+        """恢复轮询，立即检查一次"""
+        if self._paused:
+            self._paused = False
+            self.interval = self.base_interval
+            self._timer.start(0)
+
+    def poke(self):
+        """取消退避，例如滚动或切换对象后让新出现的行尽快同步"""
+        if self._paused or self.interval == self.base_interval:
+            return
+        self.interval = self.base_interval
+        self._timer.start(self.interval)
+
+    def _tick(self):
+        self.ticks += 1
+        include_offscreen = self.ticks % self.offscreen_every == 0
+        began = time.perf_counter()
+        checked, changed = self.check(include_offscreen)
+        self.last_cost = (time.perf_counter() - began) * 1000.0
+        # 指数移动平均，平滑偶发的慢检查
+        self.average_cost += (self.last_cost - self.average_cost) * 0.1
+        self.last_checked, self.last_changed = checked, changed
+
+        if changed:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        self.tick_finished.emit(self.stats)
+        if not self._paused:
+            self._timer.start(self.interval)
@@ -0,0 +1,70 @@
+import copy
+
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, pyqtSignal
+from _utils import values_equal
+
+
+class QMonoPresetMorph(QObject):
+    """
+    预设渐变
+    按显示帧率在两个预设之间插值，每帧只通过一次批量更新写入发生变化的字段
+    """
+
+    finished = pyqtSignal()
+
+    def __init__(self, inspector, bank, parent=None):
+        """
+        Args:
+            inspector: 用于批量写入的QMonoInspector
+            bank: 提供插值的MonoPresetBank
+        """
+        super().__init__(parent)
+        self.inspector = inspector
+        self.bank = bank
+        self._start = {}
+        self._end = {}
+        self._last = {}
+        self._duration = 1
+        self._clock = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._step)
+
+    def is_running(self):
+        return self._timer.isActive()
+
+    def start(self, start, end, duration=1000, interval=16):
+        """
+        开始渐变
+
+        Args:
+            start, end: 预设名或值字典
+            duration: 渐变时长(毫秒)
+            interval: 帧间隔(毫秒)
+        """
+        start, end = self.bank.values(start), self.bank.values(end)
+        # 只有两端不同的字段需要逐帧计算
+        self._start = {field: start[field] for field in end if field in start}
+        # 目标值取副本，非数值字段写入对象后不会与预设共享
+        self._end = {field: copy.deepcopy(end[field]) for field in self._start
+                     if not values_equal(end[field], start[field])}
+        self._start = {field: self._start[field] for field in self._end}
+        self._last = dict(self._start)
+        self._duration = max(1, duration)
+        self._clock.start()
+        self._timer.start(interval)
+
+    def stop(self):
+        """停止渐变，保留当前帧的值"""
+        self._timer.stop()
+
+    def _step(self):
+        t = self._clock.elapsed() / self._duration
+        frame = self.bank.interpolate(self._start, self._end, t)
+        changed = {field: value for field, value in frame.items() 
+                   if not values_equal(self._last.get(field), value)}
+        if changed:
+            self._last.update(changed)
+            self.inspector.apply_values(changed)
+        if t >= 1.0:
+            self._timer.stop()
+            self.finished.emit()
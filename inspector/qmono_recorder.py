@@ -0,0 +1,161 @@
+import csv
+import time
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import QObject, QTimer, QPointF
+from PyQt6.QtGui import QPainter, QPolygonF
+from PyQt6 import sip
+from mono import ComputedError
+from _utils import RingBuffer, get_path
+
+
+class QSparkline(QWidget):
+    """内联的迷你折线图，显示环形缓冲区中抽稀后的数据"""
+
+    def __init__(self, buffer, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+        self._drawn_version = -1
+        self.setFixedHeight(24)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+    def refresh(self):
+        """缓冲区有新数据且控件可见时才重绘"""
+        if self.buffer.version != self._drawn_version and self.isVisible():
+            self.update()
+
+    def paintEvent(self, event):
+        self._drawn_version = self.buffer.version
+        width = self.width()
+        # 每两个像素一个区间，点数与缓冲区大小无关
+        points = self.buffer.decimate(max(1, width // 2))
+        if len(points) < 2:
+            return
+
+        t0, t1 = points[0][0], points[-1][0]
+        values = [value for _, value in points]
+        v0, v1 = min(values), max(values)
+        t_span = (t1 - t0) or 1.0
+        v_span = (v1 - v0) or 1.0
+        height = self.height() - 2
+
+        polygon = QPolygonF([
+            QPointF((t - t0) / t_span * (width - 1), 1 + height - (v - v0) / v_span * height)
+            for t, v in points
+        ])
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.palette().highlight().color())
+        painter.drawPolyline(polygon)
+        painter.end()
+
+
+class QMonoRecorder(QObject):
+    """
+    参数时间序列记录器
+    每个属性一个定长环形缓冲区，可订阅变化信号，也可按固定间隔采样外部线程修改的值
+    record() 只做一次字典查找和一次数组写入，可以承受kHz级的调用频率
+    """
+
+    def __init__(self, mono, names=(), capacity=4096, interval=None, parent=None):
+        """
+        Args:
+            mono: 被记录的Mono对象
+            names: 要记录的属性名(可以是点分路径)
+            capacity: 每个属性保留的数据点数
+            interval: 采样间隔(毫秒)，为None时只记录通过record()送入的值
+        """
+        super().__init__(parent)
+        self.mono = mono
+        self.capacity = capacity
+        self.buffers = {}
+        self.sparklines = {}
+        for name in names:
+            self.add(name)
+
+        self._sample_timer = QTimer(self)
+        self._sample_timer.timeout.connect(self.sample)
+        if interval:
+            self._sample_timer.start(interval)
+
+        # 显示按帧率刷新，与记录频率解耦
+        self._display_timer = QTimer(self)
+        self._display_timer.timeout.connect(self._refresh_sparklines)
+        self._display_timer.start(33)
+
+    def __contains__(self, name):
+        return name in self.buffers
+
+    def add(self, name):
+        """开始记录一个属性"""
+        if name not in self.buffers:
+            self.buffers[name] = RingBuffer(self.capacity)
+        return self.buffers[name]
+
+    def remove(self, name):
+        """停止记录一个属性"""
+        self.buffers.pop(name, None)
+        sparkline = self.sparklines.pop(name, None)
+        if sparkline is not None:
+            sparkline.setParent(None)
+
+    def record(self, name, value, timestamp=None):
+        """记录一个值，非数值会被忽略，可直接连接到parameter_changed"""
+        buffer = self.buffers.get(name)
+        if buffer is None or not isinstance(value, (int, float)):
+            return
+        buffer.append(time.perf_counter() if timestamp is None else timestamp, value)
+
+    def record_many(self, values):
+        """以同一时间戳记录多个值，可直接连接到parameters_changed"""
+        now = time.perf_counter()
+        for name, value in values.items():
+            self.record(name, value, now)
+
+    def sample(self):
+        """读取对象当前值并记录"""
+        now = time.perf_counter()
+        for name in self.buffers:
+            try:
+                value = get_path(self.mono, name)
+            except (AttributeError, ComputedError):
+                continue
+            self.record(name, value, now)
+
+    def create_sparkline(self, name, parent=None):
+        """为属性创建迷你折线图"""
+        sparkline = QSparkline(self.add(name), parent)
+        self.sparklines[name] = sparkline
+        # 所在的属性项被销毁时一并移除
+        sparkline.destroyed.connect(lambda _=None, name=name: self._forget_sparkline(name))
+        return sparkline
+
+    def detach_sparklines(self):
+        """解除所有迷你折线图，属性项重建时调用，缓冲区保留"""
+        self.sparklines.clear()
+
+    def _forget_sparkline(self, name):
+        sparkline = self.sparklines.get(name)
+        if sparkline is not None and sip.isdeleted(sparkline):
+            del self.sparklines[name]
+
+    def _refresh_sparklines(self):
+        for name, sparkline in list(self.sparklines.items()):
+            if sip.isdeleted(sparkline):
+                del self.sparklines[name]
+            else:
+                sparkline.refresh()
+
+    def export(self, path):
+        """导出为CSV文件，每行为 name,time,value"""
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name', 'time', 'value'])
+            for name, buffer in self.buffers.items():
+                times, values = buffer.snapshot()
+                writer.writerows((name, t, v) for t, v in zip(times, values))
+
+    def stop(self):
+        """停止采样和刷新"""
+        self._sample_timer.stop()
+        self._display_timer.stop()
@@ -0,0 +1,94 @@
+from PyQt6.QtGui import QFont, QPalette, QColor
+
+
+class QMonoTheme:
+    """
+    检查器主题
+    样式表只在检查器上设置一次，字体和调色板按主题缓存并在所有属性项之间共享
+    """
+
+    # 字体角色: (字号, 是否粗体)，字号为None时使用默认字号
+    FONT_ROLES = {
+        'title': (16, True),
+        'name': (None, True),
+    }
+
+    def __init__(self, name, stylesheet='', colors=None, fonts=None):
+        """
+        Args:
+            name: 主题名称
+            stylesheet: 应用到整个检查器的样式表
+            colors: {QPalette.ColorRole名称: 颜色}，为None时使用应用程序调色板
+            fonts: 覆盖FONT_ROLES中的字体设置
+        """
+        self.name = name
+        self.stylesheet = stylesheet
+        self.colors = colors
+        self.font_roles = dict(self.FONT_ROLES, **(fonts or {}))
+        self._fonts = {}
+        self._palette = None
+
+    def font(self, role):
+        """获取缓存的字体，同一主题的所有控件共享同一个QFont"""
+        font = self._fonts.get(role)
+        if font is None:
+            size, bold = self.font_roles[role]
+            font = QFont()
+            if size is not None:
+                font.setPointSize(size)
+            font.setBold(bold)
+            self._fonts[role] = font
+        return font
+
+    def palette(self):
+        """获取缓存的调色板，未定义颜色时返回None"""
+        if self.colors is None:
+            return None
+        if self._palette is None:
+            palette = QPalette()
+            for role, color in self.colors.items():
+                palette.setColor(getattr(QPalette.ColorRole, role), QColor(color))
+            self._palette = palette
+        return self._palette
+
+
+DEFAULT_THEME = 'light'
+
+_themes = {}
+
+
+def register_theme(theme):
+    """注册主题，可通过名称切换"""
+    _themes[theme.name] = theme
+    return theme
+
+
+def get_theme(theme):
+    """按名称获取主题，传入QMonoTheme时原样返回"""
+    if isinstance(theme, QMonoTheme):
+        return theme
+    try:
+        return _themes[theme]
+    except KeyError:
+        raise ValueError("Unknown theme: {!r}".format(theme)) from None
+
+
+register_theme(QMonoTheme('light'))
+
+register_theme(QMonoTheme(
+    'dark',
+    stylesheet="QLabel#monoAttrName { color: #a9b7c6; }",
+    colors={
+        'Window': '#2b2b2b',
+        'WindowText': '#dddddd',
+        'Base': '#3c3f41',
+        'AlternateBase': '#323232',
+        'Text': '#dddddd',
+        'Button': '#3c3f41',
+        'ButtonText': '#dddddd',
+        'Highlight': '#4b6eaf',
+        'HighlightedText': '#ffffff',
+        'ToolTipBase': '#3c3f41',
+        'ToolTipText': '#dddddd',
+    },
+))
@@ -1,5 +1,10 @@
 # mono 模块初始化文件
 from .mono import Mono
 from .mono_attr import MonoAttr
+from .mono_group import MonoGroup
+from .mono_journal import MonoJournal
+from .mono_sweep import MonoSweep, SweepTable
+from .mono_computed import computed, ComputedError
+from .mono_preset import MonoPresetBank
 
-__all__ = ['Mono', 'MonoAttr']
\ No newline at end of file
+__all__ = ['Mono', 'MonoAttr', 'MonoGroup', 'MonoJournal', 'MonoSweep', 'SweepTable', 'computed', 'ComputedError', 'MonoPresetBank']
\ No newline at end of file
@@ -1,11 +1,102 @@
+from _utils import IdOrderedDict, resolve_path
+from .mono_computed import build_graph
+
+
 class Mono:
     """Mono 基类，用于创建可管理的参数对象"""
-    
-    def __init__(self):
-        """初始化Mono对象"""
+
+    # 派生属性依赖图，每个子类在定义时建立一次
+    _computed_attrs = {}
+    _affected = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._computed_attrs, cls._affected = build_graph(cls)
+
+    def __init__(self, attrs=None):
+        """
+        初始化Mono对象
+
+        Args:
+            attrs: 可选的MonoAttr列表，用于声明参数及其元数据
+        """
         self.monos = []
         self.env = {}
-    
+        self._attrs = IdOrderedDict()
+        for attr in attrs or []:
+            self.add_attr(attr)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        affected = type(self)._affected.get(name)
+        if affected:
+            self._recompute(affected)
+
+    def _recompute(self, names):
+        """按拓扑顺序重新计算已缓存的派生属性，未被读取过的派生属性保持惰性"""
+        values = self.__dict__.get('_computed_values')
+        if not values:
+            return
+        computed_attrs = type(self)._computed_attrs
+        for name in names:
+            if name in values:
+                # 计算失败时缓存ComputedError，读取时抛出，直到输入再次变化
+                values[name] = computed_attrs[name].evaluate(self)
+
+    def is_computed(self, name):
+        """判断是否为派生属性"""
+        return name in type(self)._computed_attrs
+
+    def affected(self, name):
+        """获取受该属性影响的派生属性名列表，按拓扑顺序排列"""
+        return type(self)._affected.get(name, [])
+
+    def add_attr(self, attr):
+        """注册MonoAttr，并将其值设置为同名属性"""
+        self._attrs[attr.name] = attr
+        setattr(self, attr.name, attr.value)
+
+    def get_attr(self, name):
+        """获取参数的MonoAttr元数据，未声明时返回None"""
+        return getattr(self, '_attrs', {}).get(name)
+
+    def validate_config(self, config, clamp=False):
+        """
+        一次性校验整份配置
+
+        Args:
+            config: {参数名: 值} 字典，参数名可以是嵌套Mono的点分路径，对象上不存在的参数会被忽略
+            clamp: 为True时将越界的值钳制到约束范围内，而不是报告错误
+
+        Returns:
+            (values, errors): 通过校验的值字典与 {参数名: 错误信息} 字典
+        """
+        values, errors = {}, {}
+        for name, value in config.items():
+            try:
+                owner, leaf = resolve_path(self, name)
+            except AttributeError:
+                continue
+            # 派生属性只读，不参与加载
+            is_computed = getattr(owner, 'is_computed', None)
+            if is_computed is not None and is_computed(leaf):
+                continue
+            if not hasattr(owner, leaf):
+                continue
+            get_attr = getattr(owner, 'get_attr', None)
+            attr = get_attr(leaf) if get_attr else None
+            error = attr.validate(value) if attr is not None else None
+            if error is None:
+                values[name] = value
+            elif clamp:
+                try:
+                    values[name] = attr.clamp(value)
+                except (TypeError, ValueError):
+                    errors[name] = error
+            else:
+                errors[name] = error
+        return values, errors
+
     def handle(self, *args, **kwargs):
         """占位方法，用于子类实现具体功能"""
-        pass
\ No newline at end of file
+        pass
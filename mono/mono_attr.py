@@ -1,21 +1,101 @@
+from _utils import rangef
+
+
 class MonoAttr:
     """MonoAttr 类，用于管理单个参数属性"""
-    
+
     def __init__(self, name, value, type_hint=None, **kwargs):
         """
         初始化MonoAttr对象
-        
+
         Args:
             name: 参数名称
             value: 参数值
             type_hint: 类型提示
-            **kwargs: 其他属性
+            **kwargs: 其他属性，range=(最小值, 最大值[, 步长])或rangef、enum=[可选值]会被编译为校验函数
         """
         self.name = name
         self.value = value
         self.type_hint = type_hint
         self.kwargs = kwargs
-        
+        self._compile_constraints()
+
+    def _compile_constraints(self):
+        """将range/enum约束一次性编译为校验函数和钳制函数"""
+        self.minimum = self.maximum = self.step = None
+        self.choices = None
+
+        rng = self.kwargs.get('range')
+        if isinstance(rng, rangef):
+            self.minimum, self.maximum = sorted((rng.start, rng.stop))
+            self.step = abs(rng.step)
+        elif rng is not None:
+            if len(rng) not in (2, 3):
+                raise ValueError("range for '{}' must be (min, max) or (min, max, step)".format(self.name))
+            self.minimum, self.maximum = rng[0], rng[1]
+            self.step = rng[2] if len(rng) == 3 else None
+
+        enum = self.kwargs.get('enum')
+        if enum is not None:
+            self.choices = list(enum)
+
+        name, lo, hi, step = self.name, self.minimum, self.maximum, self.step
+        as_int = isinstance(self.value, int) and not isinstance(self.value, bool)
+
+        if self.choices is not None:
+            choices = self.choices
+            try:
+                allowed = frozenset(choices)
+            except TypeError:
+                allowed = choices
+
+            def contains(value):
+                try:
+                    return value in allowed
+                except TypeError:
+                    return False
+
+            def validate(value):
+                if not contains(value):
+                    return "{}: {!r} is not one of {!r}".format(name, value, choices)
+                return None
+
+            def clamp(value):
+                return value if contains(value) else choices[0]
+
+        elif lo is not None:
+            def validate(value):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    return "{}: expected a number, got {!r}".format(name, value)
+                if not lo <= value <= hi:
+                    return "{}: {!r} is out of range [{}, {}]".format(name, value, lo, hi)
+                return None
+
+            def clamp(value):
+                value = min(max(float(value), lo), hi)
+                if step:
+                    # 对齐到 lo + n*step 的网格上
+                    value = min(lo + round((value - lo) / step) * step, hi)
+                return int(round(value)) if as_int else value
+
+        else:
+            def validate(value):
+                return None
+
+            def clamp(value):
+                return value
+
+        self._validate = validate
+        self._clamp = clamp
+
+    def validate(self, value):
+        """校验值，合法时返回None，否则返回错误信息"""
+        return self._validate(value)
+
+    def clamp(self, value):
+        """将值限制到约束范围内"""
+        return self._clamp(value)
+
     def to_dict(self):
         """将MonoAttr转换为字典"""
         return {
@@ -24,7 +104,7 @@ class MonoAttr:
             'type_hint': self.type_hint,
             **self.kwargs
         }
-    
+
     @classmethod
     def from_dict(cls, data):
         """从字典创建MonoAttr"""
@@ -33,4 +113,4 @@ class MonoAttr:
             value=data['value'],
             type_hint=data.get('type_hint'),
             **{k: v for k, v in data.items() if k not in ['name', 'value', 'type_hint']}
-        )
\ No newline at end of file
+        )
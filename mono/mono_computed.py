@@ -0,0 +1,109 @@
+class ComputedError(Exception):
+    """派生属性计算失败，error为计算函数抛出的原始异常"""
+
+    def __init__(self, name, error):
+        super().__init__("computed attribute '{}' failed: {}: {}".format(name, type(error).__name__, error))
+        self.name = name
+        self.error = error
+
+
+class computed:
+    """
+    派生属性装饰器，声明由其他属性计算得到的只读属性
+
+    示例:
+        >>> class ImageProcessor(Mono):
+        ...     @computed('resize_width', 'resize_height')
+        ...     def aspect_ratio(self):
+        ...         return self.resize_width / self.resize_height
+    """
+
+    def __init__(self, *inputs):
+        """
+        Args:
+            *inputs: 计算所依赖的属性名，可以是其他派生属性
+        """
+        self.inputs = inputs
+        self.func = None
+        self.name = None
+
+    def __call__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+        return self
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        values = obj.__dict__.setdefault('_computed_values', {})
+        try:
+            value = values[self.name]
+        except KeyError:
+            value = values[self.name] = self.evaluate(obj)
+        if isinstance(value, ComputedError):
+            # 失败的结果同样被缓存，直到输入变化后重新计算
+            raise ComputedError(self.name, value.error) from value.error
+        return value
+
+    def evaluate(self, obj):
+        """调用计算函数，失败时返回ComputedError而不是抛出"""
+        try:
+            return self.func(obj)
+        except Exception as e:
+            return ComputedError(self.name, e)
+
+    def __set__(self, obj, value):
+        raise AttributeError("computed attribute '{}' is read-only".format(self.name))
+
+
+def build_graph(cls):
+    """
+    为类建立派生属性的依赖图
+
+    Returns:
+        (computed_attrs, affected)
+        computed_attrs: {派生属性名: computed}
+        affected: {属性名: 受其影响的派生属性名列表(按拓扑顺序)}
+    """
+    computed_attrs = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, computed):
+                computed_attrs[name] = value
+
+    # Kahn算法求拓扑顺序，只统计派生属性之间的依赖
+    indegree = {name: 0 for name in computed_attrs}
+    dependents = {}
+    for name, attr in computed_attrs.items():
+        for source in attr.inputs:
+            dependents.setdefault(source, []).append(name)
+            if source in computed_attrs:
+                indegree[name] += 1
+    order = []
+    ready = [name for name, degree in indegree.items() if degree == 0]
+    while ready:
+        name = ready.pop()
+        order.append(name)
+        for target in dependents.get(name, ()):
+            indegree[target] -= 1
+            if indegree[target] == 0:
+                ready.append(target)
+    if len(order) != len(computed_attrs):
+        cycle = sorted(set(computed_attrs) - set(order))
+        raise ValueError("computed attributes of {} form a cycle: {}".format(cls.__name__, cycle))
+
+    rank = {name: i for i, name in enumerate(order)}
+    affected = {}
+    for source in dependents:
+        reached = set()
+        stack = list(dependents[source])
+        while stack:
+            name = stack.pop()
+            if name not in reached:
+                reached.add(name)
+                stack.extend(dependents.get(name, ()))
+        affected[source] = sorted(reached, key=rank.__getitem__)
+    return computed_attrs, affected
@@ -0,0 +1,113 @@
+import copy
+
+from _utils import values_equal, public_attrs
+from .mono import Mono
+from .mono_computed import ComputedError
+
+
+class MonoGroup:
+    """
+    多个Mono实例的代理对象，用于批量编辑
+    只暴露所有实例共有的属性，写入时同步到每一个实例
+    """
+
+    def __init__(self, monos):
+        """
+        初始化MonoGroup对象
+
+        Args:
+            monos: Mono实例序列，至少包含一个实例
+        """
+        monos = list(monos)
+        if not monos:
+            raise ValueError("MonoGroup requires at least one mono")
+        object.__setattr__(self, '_monos', monos)
+        names = self._shared_names(monos)
+        object.__setattr__(self, '_names', names)
+        object.__setattr__(self, '_name_set', frozenset(names))
+
+    @staticmethod
+    def _shared_names(monos):
+        """按第一个实例的顺序求所有实例共有的属性名"""
+        names = public_attrs(monos[0])
+        for mono in monos[1:]:
+            shared = set(public_attrs(mono))
+            names = [name for name in names if name in shared]
+        return names
+
+    @property
+    def instances(self):
+        """被代理的Mono实例列表"""
+        return list(self._monos)
+
+    def __len__(self):
+        return len(self._monos)
+
+    def __dir__(self):
+        return list(self._names)
+
+    def __getattr__(self, name):
+        # 仅在常规查找失败时调用，返回第一个实例的值作为代表值
+        if not name.startswith('_') and name in self._name_set:
+            value = getattr(self._monos[0], name)
+            if isinstance(value, Mono):
+                # 嵌套的Mono同样以组的形式返回，使点分路径的写入也能同步到每个实例
+                values = [getattr(mono, name) for mono in self._monos]
+                if all(isinstance(v, Mono) for v in values):
+                    return MonoGroup(values)
+            return value
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in self._name_set:
+            # 每个实例写入独立的副本，避免原地修改一个实例时影响其他实例
+            for mono in self._monos:
+                setattr(mono, name, copy.deepcopy(value))
+        else:
+            object.__setattr__(self, name, value)
+
+    def get_attr(self, name):
+        """获取参数的MonoAttr元数据，以第一个实例为准"""
+        get_attr = getattr(self._monos[0], 'get_attr', None)
+        return get_attr(name) if get_attr else None
+
+    def validate_config(self, config, clamp=False):
+        """批量校验配置，只接受共有属性，约束以第一个实例为准"""
+        config = {name: value for name, value in config.items()
+                  if name.split('.', 1)[0] in self._name_set}
+        validate_config = getattr(self._monos[0], 'validate_config', None)
+        if validate_config is None:
+            return config, {}
+        return validate_config(config, clamp)
+
+    def is_computed(self, name):
+        """判断是否为派生属性，以第一个实例为准"""
+        is_computed = getattr(self._monos[0], 'is_computed', None)
+        return bool(is_computed and is_computed(name))
+
+    def affected(self, name):
+        """获取受该属性影响的派生属性名列表，以第一个实例为准"""
+        affected = getattr(self._monos[0], 'affected', None)
+        return affected(name) if affected else []
+
+    def is_mixed(self, name):
+        """判断各实例在该属性上的值是否不一致"""
+        values = [self._read(mono, name) for mono in self._monos]
+        first = values[0]
+        return not all(values_equal(value, first) for value in values[1:])
+
+    @staticmethod
+    def _read(mono, name):
+        # 计算失败的派生属性以ComputedError类参与比较，全部失败时不视为不一致
+        try:
+            return getattr(mono, name)
+        except ComputedError:
+            return ComputedError
+
+    def update(self, values):
+        """一次性将多个属性值写入所有实例，只处理共有属性"""
+        values = {name: value for name, value in values.items() if name in self._name_set}
+        for mono in self._monos:
+            for name, value in values.items():
+                setattr(mono, name, copy.deepcopy(value))
+        return values
@@ -0,0 +1,313 @@
+import json
+import os
+import re
+import threading
+import time
+
+from _utils import has_path, set_path
+
+
+class MonoJournal:
+    """
+    参数变更日志
+    每次参数变化追加一条紧凑记录，后台将日志折叠为快照，可快速回放或回放到任意时间点
+    默认保留折叠过的日志段及其检查点，压缩只加速回放，不丢失审计历史
+
+    文件布局:
+        path                    追加写入的日志，每行一条 [时间戳, 参数名, 值]
+        path.segment            压缩中的日志段
+        path.archive.NNNNNN     已折叠的日志段(keep_history=True)
+        path.snapshot.NNNNNN    折叠完对应日志段后的检查点 {"time": 时间戳, "state": {...}}
+        path.snapshot           折叠后的快照(keep_history=False)
+
+    示例:
+        >>> journal = MonoJournal("params.journal")
+        >>> inspector.parameter_changed.connect(journal.record)
+        >>> state = journal.replay()
+    """
+
+    def __init__(self, path, buffer_size=65536, fsync_interval=1.0, compact_threshold=10000, keep_history=True):
+        """
+        初始化MonoJournal对象
+
+        Args:
+            path: 日志文件路径
+            buffer_size: 写缓冲区大小(字节)
+            fsync_interval: 两次fsync之间的最长间隔(秒)
+            compact_threshold: 日志记录数达到该值时自动在后台压缩，为None时不自动压缩
+            keep_history: 是否保留折叠过的日志段，为False时压缩会删除日志段，无法回放到最近一次压缩之前
+        """
+        self.path = path
+        self.segment_path = path + '.segment'
+        self.snapshot_path = path + '.snapshot'
+        self.buffer_size = buffer_size
+        self.fsync_interval = fsync_interval
+        self.compact_threshold = compact_threshold
+        self.keep_history = keep_history
+
+        self._lock = threading.Lock()
+        self._fold_lock = threading.Lock()
+        self._sync_timer = None
+        self._compactor = None
+        self._last_sync = time.monotonic()
+        self._archives = self._scan_archives()
+        self._checkpoint_times = {}
+
+        # 上次压缩中途退出时遗留的日志段先折叠进快照
+        if os.path.exists(self.segment_path):
+            self._fold(self.segment_path)
+
+        self._count = self._repair_tail()
+        self._file = open(self.path, 'a', encoding='utf-8', buffering=buffer_size)
+
+    def _archive_path(self, seq):
+        return '{}.archive.{:06d}'.format(self.path, seq)
+
+    def _checkpoint_path(self, seq):
+        return '{}.snapshot.{:06d}'.format(self.path, seq)
+
+    def _scan_archives(self):
+        """按序号返回已有的日志段归档"""
+        directory, base = os.path.split(self.path)
+        pattern = re.compile(re.escape(base) + r'\.archive\.(\d+)$')
+        seqs = []
+        for name in os.listdir(directory or '.'):
+            match = pattern.match(name)
+            if match:
+                seqs.append(int(match.group(1)))
+        return sorted(seqs)
+
+    def _repair_tail(self):
+        """补全崩溃时未写完的末尾行，避免新记录与其拼接，返回日志行数"""
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, 'rb+') as f:
+            count = sum(1 for _ in f)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+        return count
+
+    def record(self, name, value, timestamp=None):
+        """追加一条参数变更记录"""
+        self._write([(name, value)], timestamp)
+
+    def record_many(self, values, timestamp=None):
+        """以同一时间戳追加多条记录"""
+        self._write(values.items(), timestamp)
+
+    def _write(self, pairs, timestamp):
+        t = time.time() if timestamp is None else timestamp
+        lines = ''.join(
+            json.dumps([t, name, value], separators=(',', ':'), ensure_ascii=False) + '\n'
+            for name, value in pairs
+        )
+        if not lines:
+            return
+        with self._lock:
+            self._file.write(lines)
+            self._count += lines.count('\n')
+            if time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync_locked()
+            elif self._sync_timer is None:
+                # 保证缓冲中的记录最迟在fsync_interval后落盘
+                self._sync_timer = threading.Timer(self.fsync_interval, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+            need_compact = self.compact_threshold is not None and self._count >= self.compact_threshold
+        if need_compact:
+            self.compact()
+
+    def sync(self):
+        """刷新缓冲区并fsync到磁盘"""
+        with self._lock:
+            if not self._file.closed:
+                self._sync_locked()
+
+    def _sync_locked(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+
+    def close(self):
+        """同步并关闭日志，等待正在进行的压缩完成"""
+        with self._lock:
+            if not self._file.closed:
+                self._sync_locked()
+                self._file.close()
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def compact(self, wait=False):
+        """
+        将当前日志折叠进快照
+        日志先被轮转为日志段，折叠在后台线程进行，期间新记录照常写入新日志
+
+        Args:
+            wait: 是否等待折叠完成；为True时先等待正在进行的压缩，再折叠此后写入的记录
+        """
+        compactor = self._compactor
+        if compactor is not None and compactor.is_alive():
+            if not wait:
+                return
+            compactor.join()
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                # 其他线程已在等待期间开始了新的压缩，它轮转时包含了此前的全部记录
+                compactor = self._compactor
+            elif self._count == 0:
+                compactor = None
+            else:
+                self._sync_locked()
+                self._file.close()
+                os.replace(self.path, self.segment_path)
+                self._file = open(self.path, 'a', encoding='utf-8', buffering=self.buffer_size)
+                self._count = 0
+                compactor = threading.Thread(target=self._fold, args=(self.segment_path,), daemon=True)
+                self._compactor = compactor
+                compactor.start()
+        if wait and compactor is not None:
+            compactor.join()
+
+    def _fold(self, segment_path):
+        """
+        把日志段应用到快照上
+        保留历史时写入新的检查点并将日志段归档，否则原子替换快照后删除日志段
+        """
+        snapshot_time, state = self._read_snapshot()
+        folded = 0
+        for t, name, value in self._read_records(segment_path):
+            state[name] = value
+            snapshot_time = t
+            folded += 1
+
+        if not folded:
+            # 日志段中只有写了一半的行，没有可归档的记录，也不需要新的检查点
+            with self._fold_lock:
+                os.remove(segment_path)
+            return
+
+        if self.keep_history:
+            seq = (self._archives[-1] if self._archives else 0) + 1
+            target = self._checkpoint_path(seq)
+        else:
+            target = self.snapshot_path
+        tmp_path = target + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'time': snapshot_time, 'state': state}, f, separators=(',', ':'), ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        with self._fold_lock:
+            # 检查点先于归档落盘，中途退出时日志段会在下次打开时重新折叠为同一个检查点
+            os.replace(tmp_path, target)
+            if self.keep_history:
+                os.replace(segment_path, self._archive_path(seq))
+                self._checkpoint_times[seq] = snapshot_time
+                self._archives.append(seq)
+            else:
+                os.remove(segment_path)
+
+    def _read_snapshot(self):
+        """读取最新的快照，保留历史时为最后一个检查点"""
+        latest = self._checkpoint_path(self._archives[-1]) if self._archives else None
+        if latest is not None and (self.keep_history or not os.path.exists(self.snapshot_path)):
+            return self._read_checkpoint(latest)
+        return self._read_checkpoint(self.snapshot_path)
+
+    @staticmethod
+    def _read_checkpoint(path):
+        if not os.path.exists(path):
+            return None, {}
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        return snapshot['time'], snapshot['state']
+
+    def _checkpoint_time(self, seq):
+        if seq not in self._checkpoint_times:
+            t = self._read_checkpoint(self._checkpoint_path(seq))[0]
+            # 旧版本会为没有记录的日志段写入time为None的检查点，它之前没有任何记录
+            self._checkpoint_times[seq] = float('-inf') if t is None else t
+        return self._checkpoint_times[seq]
+
+    def _live_paths(self):
+        """尚未折叠的日志文件"""
+        return [self.segment_path, self.path] if os.path.exists(self.segment_path) else [self.path]
+
+    @staticmethod
+    def _read_records(path):
+        """逐条读取日志记录，忽略崩溃时写了一半的末尾行"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    t, name, value = json.loads(line)
+                except ValueError:
+                    continue
+                yield t, name, value
+
+    def history(self):
+        """按时间顺序返回所有保留的记录，不保留历史时只包含最近一次压缩之后的记录"""
+        self.sync()
+        with self._fold_lock:
+            paths = [self._archive_path(seq) for seq in self._archives] + self._live_paths()
+            return [record for path in paths for record in self._read_records(path)]
+
+    def replay(self, until=None):
+        """
+        回放日志，返回参数状态字典
+
+        Args:
+            until: 回放到该时间戳(含)为止，为None时回放全部记录
+        """
+        self.sync()
+        with self._fold_lock:
+            archives = self._archives
+            # 二分查找until之后的第一个检查点，从它的前一个检查点开始回放
+            lo, hi = 0, len(archives)
+            if until is None:
+                lo = hi
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._checkpoint_time(archives[mid]) <= until:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo == len(archives):
+                snapshot_time, state = self._read_snapshot()
+                paths = self._live_paths()
+            elif lo > 0:
+                snapshot_time, state = self._read_checkpoint(self._checkpoint_path(archives[lo - 1]))
+                paths = [self._archive_path(seq) for seq in archives[lo:]] + self._live_paths()
+            else:
+                # 第一个归档之前只可能有不保留历史时留下的快照
+                snapshot_time, state = self._read_checkpoint(self.snapshot_path)
+                if snapshot_time is not None and snapshot_time > self._checkpoint_time(archives[0]):
+                    snapshot_time, state = None, {}
+                paths = [self._archive_path(seq) for seq in archives] + self._live_paths()
+            if until is not None and snapshot_time is not None and until < snapshot_time:
+                raise ValueError("cannot seek before the last compaction at {}".format(snapshot_time))
+            for path in paths:
+                for t, name, value in self._read_records(path):
+                    if until is not None and t > until:
+                        return state
+                    state[name] = value
+        return state
+
+    def restore(self, mono, until=None):
+        """将回放得到的状态写回Mono对象，支持点分路径，返回实际写入的值"""
+        values = {name: value for name, value in self.replay(until).items() if has_path(mono, name)}
+        for name, value in values.items():
+            set_path(mono, name, value)
+        return values
@@ -0,0 +1,132 @@
+import copy
+import json
+
+from _utils import IdOrderedDict, values_equal, resolve_path, get_path, set_path, has_path, public_attrs
+from .mono import Mono
+
+
+class MonoPresetBank:
+    """
+    参数预设库
+    预设保存在内存中并与Mono的属性结构绑定，切换时只应用不同的字段
+
+    示例:
+        >>> bank = MonoPresetBank(ImageProcessor)
+        >>> bank.capture("daylight", processor)
+        >>> bank.diff(processor, "night")
+        {'brightness': 0.6, 'contrast': 1.4}
+    """
+
+    def __init__(self, schema):
+        """
+        初始化MonoPresetBank对象
+
+        Args:
+            schema: Mono子类或实例，其公开的非派生属性构成预设的字段，嵌套Mono的属性以点分路径表示
+        """
+        mono = schema() if isinstance(schema, type) else schema
+        self.names = tuple(self._schema_names(mono))
+        self._name_set = frozenset(self.names)
+        self.presets = IdOrderedDict()
+
+    @classmethod
+    def _schema_names(cls, mono, prefix=''):
+        is_computed = getattr(mono, 'is_computed', None)
+        for name in sorted(public_attrs(mono)):
+            if is_computed and is_computed(name):
+                continue
+            value = getattr(mono, name)
+            if isinstance(value, Mono):
+                yield from cls._schema_names(value, prefix + name + '.')
+            else:
+                yield prefix + name
+
+    def __contains__(self, name):
+        return name in self.presets
+
+    def __len__(self):
+        return len(self.presets)
+
+    def __getitem__(self, name):
+        return self.presets[name]
+
+    def add(self, name, values):
+        """添加或替换预设，字段必须属于预设结构"""
+        unknown = set(values) - self._name_set
+        if unknown:
+            raise ValueError("Unknown preset fields: {}".format(sorted(unknown)))
+        self.presets[name] = copy.deepcopy(dict(values))
+
+    def capture(self, name, mono):
+        """将Mono对象的当前状态保存为预设"""
+        self.add(name, {field: get_path(mono, field) for field in self.names if has_path(mono, field)})
+
+    def remove(self, name):
+        """删除预设"""
+        self.presets.pop(name)
+
+    def diff(self, mono, name):
+        """
+        返回切换到预设需要修改的字段，值为副本，写入对象后不会与预设共享
+        mono为MonoGroup时，各实例取值不一致的字段也会被包含，使所有实例都切换到预设
+        """
+        changed = {}
+        for field, value in self.presets[name].items():
+            owner, leaf = resolve_path(mono, field)
+            is_mixed = getattr(owner, 'is_mixed', None)
+            if not values_equal(getattr(owner, leaf), value) or (is_mixed is not None and is_mixed(leaf)):
+                changed[field] = copy.deepcopy(value)
+        return changed
+
+    def apply(self, mono, name):
+        """将预设中不同的字段写入Mono对象，返回实际写入的值"""
+        changed = self.diff(mono, name)
+        for field, value in changed.items():
+            set_path(mono, field, value)
+        return changed
+
+    def values(self, preset):
+        """获取预设的值字典，preset为预设名或值字典"""
+        return self.presets[preset] if isinstance(preset, str) else preset
+
+    def interpolate(self, start, end, t):
+        """
+        在两个预设之间插值
+
+        Args:
+            start, end: 预设名或值字典
+            t: 插值系数，0为start，1为end
+
+        Returns:
+            数值字段线性插值(整数四舍五入)，其他字段在t>=0.5时取end的值
+        """
+        start, end = self.values(start), self.values(end)
+        t = min(max(t, 0.0), 1.0)
+        values = {}
+        for field, b in end.items():
+            if field not in start:
+                values[field] = b
+                continue
+            a = start[field]
+            if self.is_numeric(a) and self.is_numeric(b):
+                value = a + (b - a) * t
+                values[field] = int(round(value)) if isinstance(a, int) and isinstance(b, int) else value
+            else:
+                values[field] = b if t >= 0.5 else a
+        return values
+
+    @staticmethod
+    def is_numeric(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    def save(self, path):
+        """保存预设库为JSON文件"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(dict(self.presets.items()), f, indent=2, ensure_ascii=False)
+
+    def load(self, path):
+        """从JSON文件加载预设，忽略不属于预设结构的字段"""
+        with open(path, 'r', encoding='utf-8') as f:
+            presets = json.load(f)
+        for name, values in presets.items():
+            self.add(name, {field: value for field, value in values.items() if field in self._name_set})
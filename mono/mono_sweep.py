@@ -0,0 +1,242 @@
+import itertools
+import json
+import os
+import random
+from array import array
+from multiprocessing import Pool
+
+from _utils import set_path
+
+
+def _run_point(task):
+    """在工作进程中创建Mono、设置参数并执行handle"""
+    factory, index, values, args, kwargs = task
+    mono = factory()
+    for name, value in values.items():
+        set_path(mono, name, value)
+    return index, values, mono.handle(*args, **kwargs)
+
+
+class SweepTable:
+    """
+    列式结果表
+    整数和浮点列使用array存储，其他类型的列退化为list
+    """
+
+    def __init__(self):
+        self._columns = {}
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def columns(self):
+        """列名列表"""
+        return list(self._columns)
+
+    def column(self, name):
+        """获取一列数据"""
+        return self._columns[name]
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def append(self, row):
+        """追加一行，缺失的列以None补齐"""
+        for name, value in row.items():
+            if name not in self._columns:
+                self._columns[name] = self._new_column(value) if self._length == 0 else [None] * self._length
+        for name, column in self._columns.items():
+            value = row.get(name)
+            if isinstance(column, array) and not self._fits(column, value):
+                # 出现无法用数值数组表示的值时退化为list
+                column = self._columns[name] = column.tolist()
+            column.append(value)
+        self._length += 1
+
+    @staticmethod
+    def _new_column(value):
+        if isinstance(value, bool):
+            return []
+        if isinstance(value, int):
+            return array('q')
+        if isinstance(value, float):
+            return array('d')
+        return []
+
+    @staticmethod
+    def _fits(column, value):
+        if isinstance(value, bool):
+            return False
+        if column.typecode == 'q':
+            return isinstance(value, int) and -2 ** 63 <= value < 2 ** 63
+        return isinstance(value, (int, float))
+
+    def row(self, index):
+        """获取第index行的字典"""
+        return {name: column[index] for name, column in self._columns.items()}
+
+    def rows(self):
+        """逐行遍历"""
+        for index in range(self._length):
+            yield self.row(index)
+
+    def to_dict(self):
+        """转换为 {列名: list} 字典"""
+        return {name: list(column) for name, column in self._columns.items()}
+
+
+class MonoSweep:
+    """
+    Mono参数扫描
+    按网格或随机方式惰性生成参数组合，在进程池中分块执行Mono.handle，结果收集为列式表
+
+    示例:
+        >>> sweep = MonoSweep(ImageProcessor, {
+        ...     'brightness': rangef(0.5, 1.5, 0.25),
+        ...     'contrast': [0.8, 1.0, 1.2],
+        ... })
+        >>> table = sweep.run(processes=4, checkpoint="sweep.jsonl")
+        >>> table['brightness'], table['result']
+    """
+
+    def __init__(self, factory, space, mode='grid', samples=None, seed=0):
+        """
+        初始化MonoSweep对象
+
+        Args:
+            factory: Mono子类或无参工厂函数，多进程执行时必须可以被pickle
+            space: {参数名: rangef或可选值列表}，参数名可以是点分路径
+            mode: 'grid' 遍历全部组合，'random' 随机抽样
+            samples: random模式下的抽样数量
+            seed: random模式下的随机种子
+        """
+        if mode not in ('grid', 'random'):
+            raise ValueError("mode must be 'grid' or 'random', got {!r}".format(mode))
+        if mode == 'random' and samples is None:
+            raise ValueError("random sweeps require samples")
+        self.factory = factory
+        self.names = list(space)
+        # 轴只展开一次，长度、索引与遍历结果一致(rangef的浮点步长可能使len与迭代次数不同)
+        self.axes = [tuple(space[name]) for name in self.names]
+        self.mode = mode
+        self.samples = samples
+        self.seed = seed
+
+    def __len__(self):
+        if self.mode == 'random':
+            return self.samples
+        total = 1
+        for axis in self.axes:
+            total *= len(axis)
+        return total
+
+    def points(self, start=0):
+        """
+        惰性生成 (序号, {参数名: 值})
+
+        Args:
+            start: 从第几个组合开始
+        """
+        if self.mode == 'grid':
+            combos = itertools.islice(itertools.product(*self.axes), start, None)
+            for index, combo in enumerate(combos, start):
+                yield index, dict(zip(self.names, combo))
+        else:
+            for index in range(start, self.samples):
+                yield index, self.point(index)
+
+    def point(self, index):
+        """获取第index个组合，随机模式下每个序号独立播种，便于断点续跑"""
+        if self.mode == 'grid':
+            values = {}
+            for name, axis in zip(reversed(self.names), reversed(self.axes)):
+                index, offset = divmod(index, len(axis))
+                values[name] = axis[offset]
+            return {name: values[name] for name in self.names}
+        rng = random.Random(self.seed * 1000003 + index)
+        return {name: axis[rng.randrange(len(axis))] for name, axis in zip(self.names, self.axes)}
+
+    def run(self, processes=None, chunksize=16, checkpoint=None, args=(), kwargs=None):
+        """
+        执行扫描
+
+        Args:
+            processes: 进程数，None为CPU核数，0表示在当前进程中执行
+            chunksize: 每次派发给工作进程的组合数
+            checkpoint: 断点文件路径，已完成的结果会被跳过，结果需要可以JSON序列化
+            args, kwargs: 传给handle的参数
+
+        Returns:
+            SweepTable，包含 index、各参数列以及结果列
+            handle返回字典时每个键成为一列，否则结果放在 result 列
+        """
+        kwargs = kwargs or {}
+        table = SweepTable()
+        done = set()
+        if checkpoint and os.path.exists(checkpoint):
+            for index, result in self._read_checkpoint(checkpoint):
+                if index not in done:
+                    done.add(index)
+                    table.append(self._row(index, self.point(index), result))
+
+        tasks = ((self.factory, index, values, args, kwargs)
+                 for index, values in self.points() if index not in done)
+        log = self._open_checkpoint(checkpoint) if checkpoint else None
+        try:
+            if processes == 0:
+                for index, values, result in map(_run_point, tasks):
+                    self._collect(table, log, index, values, result)
+            else:
+                with Pool(processes) as pool:
+                    # 分批提交，避免进程池一次性把整个组合流读入内存
+                    batch_size = chunksize * (processes or os.cpu_count() or 1) * 4
+                    while True:
+                        batch = list(itertools.islice(tasks, batch_size))
+                        if not batch:
+                            break
+                        for index, values, result in pool.imap(_run_point, batch, chunksize):
+                            self._collect(table, log, index, values, result)
+                        if log is not None:
+                            log.flush()
+        finally:
+            if log is not None:
+                log.close()
+        return table
+
+    def _collect(self, table, log, index, values, result):
+        table.append(self._row(index, values, result))
+        if log is not None:
+            log.write(json.dumps([index, result], separators=(',', ':'), ensure_ascii=False) + '\n')
+
+    @staticmethod
+    def _row(index, values, result):
+        row = {'index': index}
+        row.update(values)
+        if isinstance(result, dict):
+            row.update(result)
+        else:
+            row['result'] = result
+        return row
+
+    @staticmethod
+    def _open_checkpoint(path):
+        """以追加方式打开断点文件，补全中断时未写完的末尾行"""
+        with open(path, 'ab+') as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+        return open(path, 'a', encoding='utf-8')
+
+    @staticmethod
+    def _read_checkpoint(path):
+        """读取断点文件，忽略中断时写了一半的末尾行"""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    index, result = json.loads(line)
+                except ValueError:
+                    continue
+                yield index, result
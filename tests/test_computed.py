@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from mono import Mono, MonoGroup, ComputedError, computed
+from _utils import public_attrs, has_path
+
+
+class Panel(Mono):
+    def __init__(self, w=4.0, h=2.0):
+        super().__init__()
+        self.w = w
+        self.h = h
+
+    @computed('w', 'h')
+    def aspect(self):
+        return self.w / self.h
+
+
+def test_failed_computed_raises_computed_error():
+    panel = Panel(h=0.0)
+    with pytest.raises(ComputedError) as info:
+        panel.aspect
+    assert isinstance(info.value.error, ZeroDivisionError)
+
+
+def test_recompute_keeps_error_until_inputs_change():
+    panel = Panel()
+    assert panel.aspect == 2.0
+    panel.h = 0.0  # 不应抛出
+    with pytest.raises(ComputedError):
+        panel.aspect
+    panel.h = 1.0
+    assert panel.aspect == 4.0
+
+
+def test_scans_do_not_evaluate_failed_computed():
+    panel = Panel(h=0.0)
+    assert 'aspect' in public_attrs(panel)
+    assert has_path(panel, 'aspect')
+    group = MonoGroup([panel, Panel()])
+    assert 'aspect' in dir(group)
+    assert group.is_mixed('aspect')
+    assert not MonoGroup([panel, Panel(h=0.0)]).is_mixed('aspect')
+
+
+def test_inspector_shows_failed_computed_as_error():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+    from inspector import QMonoInspector
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    panel = Panel(h=0.0)
+    inspector = QMonoInspector()
+    inspector.set_mono(panel)
+    item = inspector.attr_items['aspect']
+    assert item.error is not None
+
+    inspector.attr_items['h'].value_widget.setValue(1.0)
+    assert panel.h == 1.0
+    assert item.error is None
+    assert item.get_value() == 4.0
+
+    inspector.attr_items['h'].value_widget.setValue(0.0)
+    assert item.error is not None
+    inspector.deleteLater()
+    app.processEvents()
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from mono import MonoJournal
+
+
+def expected_state(records, until):
+    state = {}
+    for t, name, value in records:
+        if t <= until:
+            state[name] = value
+    return state
+
+
+def test_replay_and_seek_across_compactions(tmp_path):
+    path = str(tmp_path / 'params.journal')
+    records = []
+    with MonoJournal(path, compact_threshold=None) as journal:
+        for t in range(1, 31):
+            record = (float(t), 'p{}'.format(t % 4), t)
+            records.append(record)
+            journal.record(record[1], record[2], timestamp=record[0])
+            if t % 10 == 0:
+                journal.compact(wait=True)
+        assert journal.replay() == expected_state(records, 30)
+        for until in (0.0, 1.0, 9.5, 10.0, 15.0, 20.0, 25.0, 30.0):
+            assert journal.replay(until) == expected_state(records, until)
+        assert [tuple(r) for r in journal.history()] == records
+
+
+def test_auto_compaction_keeps_history_across_reopen(tmp_path):
+    path = str(tmp_path / 'params.journal')
+    with MonoJournal(path, compact_threshold=4) as journal:
+        for t in range(1, 11):
+            journal.record('x', t, timestamp=float(t))
+    with MonoJournal(path, compact_threshold=4) as journal:
+        assert [r[2] for r in journal.history()] == list(range(1, 11))
+        assert journal.replay() == {'x': 10}
+        assert journal.replay(3.0) == {'x': 3}
+
+
+def test_segment_without_records_is_not_checkpointed(tmp_path):
+    path = str(tmp_path / 'params.journal')
+    # 崩溃时写了一半的行会被计数并轮转，但折叠后没有任何记录
+    (tmp_path / 'params.journal').write_text('[1.0,"x"')
+    with MonoJournal(path, compact_threshold=None) as journal:
+        journal.compact(wait=True)
+        journal.record('x', 2, timestamp=2.0)
+        journal.compact(wait=True)
+        journal.record('x', 3, timestamp=3.0)
+        assert journal.replay(2.5) == {'x': 2}
+        assert journal.replay(1.0) == {}
+        assert journal.replay() == {'x': 3}
+    assert not (tmp_path / 'params.journal.archive.000002').exists()
+
+    (tmp_path / 'params.journal.segment').write_text('garbage\n')
+    with MonoJournal(path, compact_threshold=None) as journal:
+        assert not (tmp_path / 'params.journal.segment').exists()
+        assert journal.replay() == {'x': 3}
+
+
+def test_legacy_checkpoint_without_time(tmp_path):
+    path = str(tmp_path / 'params.journal')
+    (tmp_path / 'params.journal.archive.000001').write_text('')
+    (tmp_path / 'params.journal.snapshot.000001').write_text(json.dumps({'time': None, 'state': {}}))
+    with MonoJournal(path, compact_threshold=None) as journal:
+        journal.record('x', 1, timestamp=1.0)
+        journal.compact(wait=True)
+        journal.record('x', 2, timestamp=2.0)
+        assert journal.replay(0.5) == {}
+        assert journal.replay(1.5) == {'x': 1}
+        assert journal.replay() == {'x': 2}
+
+
+def test_seek_before_compaction_without_history(tmp_path):
+    path = str(tmp_path / 'params.journal')
+    with MonoJournal(path, compact_threshold=None, keep_history=False) as journal:
+        journal.record('x', 1, timestamp=1.0)
+        journal.record('x', 2, timestamp=2.0)
+        journal.compact(wait=True)
+        journal.record('x', 3, timestamp=3.0)
+        assert journal.replay(2.0) == {'x': 2}
+        assert journal.replay() == {'x': 3}
+        with pytest.raises(ValueError):
+            journal.replay(1.0)
@@ -0,0 +1,44 @@
+import pytest
+
+from mono import Mono, MonoSweep
+from _utils import rangef
+
+
+class Adder(Mono):
+    def __init__(self):
+        super().__init__()
+        self.a = 0.0
+        self.b = 0
+
+    def handle(self):
+        return self.a + self.b
+
+
+def test_grid_rows_match_their_results():
+    # rangef(0, 1, 0.1) 的len与实际迭代次数不同
+    sweep = MonoSweep(Adder, {'a': rangef(0, 1, 0.1), 'b': [0, 1]})
+    table = sweep.run(processes=0)
+    assert len(table) == len(sweep)
+    for row in table.rows():
+        assert row['result'] == pytest.approx(row['a'] + row['b'])
+        assert sweep.point(row['index']) == {'a': row['a'], 'b': row['b']}
+
+
+def test_checkpoint_resume_skips_done_points(tmp_path):
+    checkpoint = str(tmp_path / 'sweep.jsonl')
+    sweep = MonoSweep(Adder, {'a': rangef(0, 1, 0.1), 'b': [0, 1]})
+    first = sweep.run(processes=0, checkpoint=checkpoint)
+    with open(checkpoint, 'a', encoding='utf-8') as f:
+        f.write('[0, 99')  # 中断时写了一半的行
+    resumed = sweep.run(processes=0, checkpoint=checkpoint)
+    assert len(resumed) == len(first)
+    assert sorted(resumed['index']) == list(range(len(sweep)))
+    for row in resumed.rows():
+        assert row['result'] == pytest.approx(row['a'] + row['b'])
+
+
+def test_random_points_are_reproducible():
+    sweep = MonoSweep(Adder, {'a': rangef(0, 1, 0.25), 'b': [0, 1, 2]}, mode='random', samples=8, seed=3)
+    assert list(sweep.points()) == list(MonoSweep(
+        Adder, {'a': rangef(0, 1, 0.25), 'b': [0, 1, 2]}, mode='random', samples=8, seed=3).points())
+    assert list(sweep.points(5)) == list(sweep.points())[5:]
@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from mono import Mono
+
+
+class Panel(Mono):
+    def __init__(self):
+        super().__init__()
+        self.w = 4.0
+        self.label = "panel"
+
+
+def test_rows_use_inspector_theme_even_with_default_name():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+    from inspector import QMonoInspector, QMonoTheme
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    # 与默认主题同名但字体不同，不能按名称判断是否需要覆盖
+    theme = QMonoTheme('light', fonts={'name': (20, True)})
+    inspector = QMonoInspector()
+    inspector.set_theme(theme)
+    inspector.set_mono(Panel())
+    for item in inspector.attr_items.values():
+        assert item.theme is theme
+        assert item.name_label.font().pointSize() == 20
+    inspector.deleteLater()
+    app.processEvents()